@@ -1,13 +1,25 @@
 import os
 import pandas as pd
-from sqlalchemy import create_engine, text, inspect
+from collections import defaultdict
+from sqlalchemy import create_engine, text, inspect, bindparam
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection as SQLConnection
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import TextClause
+from typing import Dict, Iterable, Optional, Tuple
 from dotenv import load_dotenv
 from loguru import logger
 
 load_dotenv()
 
+# Every Connection to the same database shares one engine, so this caps the whole process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_POOL_TIMEOUT = 120
+
+_engines: Dict[str, Engine] = {}
+# SQL files never change while the process runs
+_sql_files: Dict[str, str] = {}
+
 
 class Connection:
     def __init__(self, db_type='mysql', database=None):
@@ -34,13 +46,23 @@ class Connection:
             raise ValueError("db_type must be either 'mysql' or 'postgres'")
 
         self.engine = self._create_engine()
+        # Compiled status UPDATE per table
+        self._status_statements: Dict[str, TextClause] = {}
 
     def _create_engine(self) -> Engine:
+        url = f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        if url in _engines:
+            return _engines[url]
+
         try:
             engine = create_engine(
-                f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
-                echo=False
+                url,
+                echo=False,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=0,
+                pool_timeout=DB_POOL_TIMEOUT
             )
+            _engines[url] = engine
 
             return engine
         except SQLAlchemyError as e:
@@ -62,18 +84,61 @@ class Connection:
 
     def get_sql_from_file(self, file_name: str) -> str:
         file_path = os.path.join("sql", file_name)
+        if file_path in _sql_files:
+            return _sql_files[file_path]
+
         try:
             with open(file_path, "r") as f:
-                return f.read()
+                _sql_files[file_path] = f.read()
+                return _sql_files[file_path]
         except FileNotFoundError:
             logger.error(f"SQL file not found: {file_path}")
             raise
 
     def update_url_scrape_status(self, pkey: int, status: str, table: str, timestamp: str) -> None:
-        sql = self.get_sql_from_file("update_url_scrape_status.sql")
-        formatted_sql = sql.format(
-            status=status, timestamp=timestamp, table_name=table, pkey=pkey)
-        self.execute_query(formatted_sql)
+        self.update_url_scrape_statuses([(pkey, status, timestamp)], table)
+
+    def update_url_scrape_statuses(self, updates: Iterable[Tuple[int, str, str]], table: str, conn: Optional[SQLConnection] = None) -> None:
+        """Apply (pkey, status, timestamp) updates with one parameterized UPDATE per status and timestamp.
+
+        Runs in ``conn``'s transaction when given, so the statuses commit
+        together with whatever else that transaction writes.
+        """
+        groups = defaultdict(list)
+        for pkey, status, timestamp in updates:
+            groups[(status, timestamp)].append(int(pkey))
+
+        if not groups:
+            return
+
+        if conn is None:
+            with self.engine.begin() as conn:
+                self._execute_status_updates(conn, groups, table)
+        else:
+            self._execute_status_updates(conn, groups, table)
+
+        counts = defaultdict(int)
+        for (status, _), pkeys in groups.items():
+            counts[status] += len(pkeys)
+        logger.info(
+            f"Updated scrape status in {table}: {', '.join(f'{status}={n}' for status, n in counts.items())}")
+
+    def _execute_status_updates(self, conn: SQLConnection, groups: Dict[Tuple[str, str], list], table: str) -> None:
+        statement = self._status_statements.get(table)
+        if statement is None:
+            sql = self.get_sql_from_file(
+                "update_url_scrape_status.sql").format(table_name=table)
+            statement = text(sql).bindparams(bindparam("pkeys", expanding=True))
+            self._status_statements[table] = statement
+
+        try:
+            for (status, timestamp), pkeys in groups.items():
+                conn.execute(
+                    statement, {"status": status, "timestamp": timestamp, "pkeys": pkeys})
+
+        except Exception as e:
+            logger.error(f"Error updating scrape status in {table}: {e}")
+            raise
 
     def extract_from_sql(self, sql: str) -> pd.DataFrame:
         try:
@@ -1,37 +1,193 @@
 import os
 import json
 import asyncio
+import nest_asyncio
 import pandas as pd
 
-from abc import ABC, abstractmethod
+from typing import Union, Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from abc import ABC
 from sqlalchemy.engine import Engine
 from .connection import Connection
-from .scraper import scrape_url
+from .staging import StagingWriter, STAGING_FLUSH_ROWS, STAGING_FLUSH_SECONDS
+from .pipeline import StageStats, PipelineStats, get_transform_pool, TRANSFORM_PROCESSES
+from .scraper import (
+    scrape_url,
+    open_page,
+    capture_json_responses,
+    fetch_soup_http,
+    polite_sleep,
+    get_browser_pool,
+    ResourceBlocker,
+    BrowserSession,
+    BrowserPool,
+    BehaviorPolicy,
+    WaitStats,
+    block_stats,
+    site_key,
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BLOCKED_DOMAINS,
+    REVIEW_WIDGET_DOMAINS
+)
 from loguru import logger
 from datetime import datetime as dt
 from bs4 import BeautifulSoup
 
+# Compatibility shim: shops that still implement the sync extract()/transform()
+# call asyncio.run(self.scrape(...)) from inside the runner loop. Remove once
+# every shop implements extract_async()/transform_async().
+nest_asyncio.apply()
+
+# Consecutive HTTP misses before a selector known to work over HTTP goes back to the browser
+HTTP_TIER_MAX_MISSES = 3
+
 
 class PetProductsETL(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for sync_hook, async_hook in [("extract", "extract_async"), ("transform", "transform_async")]:
+            if (getattr(cls, sync_hook) is getattr(PetProductsETL, sync_hook)
+                    and getattr(cls, async_hook) is getattr(PetProductsETL, async_hook)):
+                raise TypeError(
+                    f"{cls.__name__} must implement {sync_hook}() or {async_hook}()")
+
     def __init__(self):
         self.SHOP = ""
         self.BASE_URL = ""
         self.SELECTOR_SCRAPE_PRODUCT_INFO = ''
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PAGES = 1
+        # Product pages fetched ahead of the one being transformed and loaded (0 disables prefetch)
+        self.PREFETCH_DEPTH = 0
+        # Run product pages through separate fetch, transform and load stages
+        self.PIPELINE = False
+        # Items a pipeline stage may queue for the next one before it waits
+        self.PIPELINE_QUEUE_SIZE = 8
+        # Threads running a sync transform() in the pipeline; 0 keeps it on the event loop
+        self.TRANSFORM_WORKERS = 2
+        # Buffered staging rows are written once this many are waiting or the oldest is this old
+        self.STAGING_FLUSH_ROWS = STAGING_FLUSH_ROWS
+        self.STAGING_FLUSH_SECONDS = STAGING_FLUSH_SECONDS
+        # Picklable module-level function(html or extracted dict, url) -> list of row dicts.
+        # When set, product pages are fetched unparsed and transformed in worker processes
+        self.TRANSFORM_PROCESS = None
+        # Size in MB of this shop's on-disk browser asset cache; 0 uses the shared pool without caching
+        self.ASSET_CACHE_MB = 0
+        self.BLOCKED_RESOURCE_TYPES = DEFAULT_BLOCKED_RESOURCE_TYPES
+        self.BLOCKED_DOMAINS = DEFAULT_BLOCKED_DOMAINS + REVIEW_WIDGET_DOMAINS
+        self.HTTP_FIRST = True
+        # Optional JS function run with page.evaluate on product pages; transform() then gets its dict
+        self.EXTRACTION_SCRIPT = None
+        # "selector" keeps only SELECTOR_SCRAPE_PRODUCT_INFO and head metadata of product pages
+        self.CAPTURE_SCOPE = "document"
+        self.BEHAVIOR_POLICY = BehaviorPolicy("sampled", sample_rate=0.1)
+        # "selector" returns as soon as the product selector renders and stops the rest of the load.
+        # Only for shops whose transform() reads nothing that scripts fill in after the selector appears
+        self.WAIT_UNTIL_PRODUCT_INFO = "load"
         self.connection = Connection()
+        self._resource_blocker = None
+        self._browser_session = None
+        self._staging_writer = None
+        # Fetch tier ("http" or "browser") that last worked, per selector
+        self._fetch_tiers = {}
+        self._http_misses = {}
+        self.wait_stats = WaitStats()
+        # Product URLs saved per scrape status in this run
+        self.scrape_counts = Counter()
+
+    @property
+    def resource_blocker(self) -> ResourceBlocker:
+        # Built lazily because shops set their BLOCKED_* attributes after super().__init__()
+        if self._resource_blocker is None:
+            self._resource_blocker = ResourceBlocker(
+                self.BLOCKED_RESOURCE_TYPES, self.BLOCKED_DOMAINS)
+        return self._resource_blocker
+
+    @property
+    def browser_session(self) -> BrowserSession:
+        # Warmed on the shop's home page the first time a request goes through it
+        if self._browser_session is None:
+            self._browser_session = BrowserSession(
+                self.BASE_URL, resource_blocker=self.resource_blocker, pool=self.browser_pool)
+        return self._browser_session
+
+    @property
+    def browser_pool(self) -> BrowserPool:
+        return get_browser_pool(self.SHOP, self.ASSET_CACHE_MB)
+
+    async def scrape(self, url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5, extraction_script=None, capture_scope="document", raw_html=False, validate=None):
+        """Fetch ``url`` over HTTP when ``selector`` is served without JavaScript, otherwise in the browser.
+
+        ``validate(page, url)`` is awaited on the first HTTP result for a
+        selector; if it returns False the markup is not good enough and the
+        browser tier is used and remembered instead.
+        """
+        tier = self._fetch_tiers.get(selector)
+        try_http = self.HTTP_FIRST and bool(selector) and tier != "browser"
+
+        if try_http:
+            soup = await fetch_soup_http(url, selector, headers, capture_scope, raw_html)
+            if soup is not None and tier is None and validate is not None and not await validate(soup, url):
+                logger.info(
+                    f"[{self.SHOP}] HTTP markup for '{selector}' fails transform, escalating to browser: {url}")
+                soup = None
+            elif soup is None:
+                logger.info(
+                    f"[{self.SHOP}] '{selector}' not found over HTTP, escalating to browser: {url}")
+
+            if soup is not None:
+                if tier is None:
+                    logger.info(
+                        f"[{self.SHOP}] '{selector}' is served without JavaScript, using HTTP tier")
+                self._fetch_tiers[selector] = "http"
+                self._http_misses[selector] = 0
+                await polite_sleep(min_sec, max_sec)
+                return soup
+
+        soup = await scrape_url(url, selector, headers, wait_until, min_sec=min_sec, max_sec=max_sec,
+                                resource_blocker=self.resource_blocker, extraction_script=extraction_script,
+                                capture_scope=capture_scope, behavior_policy=self.BEHAVIOR_POLICY,
+                                wait_stats=self.wait_stats, pool=self.browser_pool, raw_html=raw_html)
+
+        if soup and try_http:
+            self._http_misses[selector] = self._http_misses.get(selector, 0) + 1
+            if tier is None or self._http_misses[selector] >= HTTP_TIER_MAX_MISSES:
+                logger.info(
+                    f"[{self.SHOP}] '{selector}' needs a browser, using browser tier")
+                self._fetch_tiers[selector] = "browser"
 
-    async def scrape(self, url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5):
-        soup = await scrape_url(url, selector, headers, wait_until, min_sec=min_sec, max_sec=max_sec)
         return soup if soup else False
 
-    @abstractmethod
+    def browser_page(self, url=None, headers=None, viewport=None):
+        """Borrow a page from the shared browser pool with this shop's blocking rules"""
+        return open_page(url, headers=headers, viewport=viewport, resource_blocker=self.resource_blocker, pool=self.browser_pool)
+
+    async def capture_json(self, url, patterns, max_responses=1, headers=None, min_sec=2, max_sec=5):
+        """Collect XHR JSON payloads matching ``patterns`` while ``url`` loads, instead of parsing its DOM"""
+        responses = await capture_json_responses(
+            url, patterns, max_responses, headers=headers, resource_blocker=self.resource_blocker,
+            pool=self.browser_pool)
+        await polite_sleep(min_sec, max_sec)
+        return responses
+
     def extract(self, category):
-        pass
+        """Sync link extraction hook, kept for shops not yet migrated to extract_async()"""
+        return asyncio.run(self.extract_async(category))
+
+    async def extract_async(self, category):
+        """Async link extraction hook; defaults to the shop's sync extract() on the runner loop"""
+        return self.extract(category)
 
-    @abstractmethod
-    def transform(self, soup: BeautifulSoup, url: str):
-        pass
+    def transform(self, soup: Union[BeautifulSoup, Dict[str, Any]], url: str):
+        """Build product rows from a page soup, or from the EXTRACTION_SCRIPT dict if the shop has one"""
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: Union[BeautifulSoup, Dict[str, Any]], url: str):
+        """Async transform hook; defaults to the shop's sync transform() on the runner loop"""
+        return self.transform(soup, url)
 
     def load(self, data: pd.DataFrame, table_name: str):
         try:
@@ -46,6 +202,9 @@ class PetProductsETL(ABC):
             raise e
 
     def get_product_infos(self):
+        asyncio.run(self.get_product_infos_async())
+
+    async def get_product_infos_async(self):
         temp_table = f"stg_{self.SHOP.lower()}_temp_products"
 
         create_temp_sql = self.connection.get_sql_from_file(
@@ -60,24 +219,35 @@ class PetProductsETL(ABC):
 
         df_urls = self.connection.extract_from_sql(sql)
 
-        for i, row in df_urls.iterrows():
-            pkey = row["id"]
-            url = row["url"]
-
-            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
-            soup = asyncio.run(self.scrape(
-                url, self.SELECTOR_SCRAPE_PRODUCT_INFO, min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO, max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO, wait_until='load'))
-            df = self.transform(soup, url)
+        self._staging_writer = StagingWriter(
+            self.connection, temp_table, max_rows=self.STAGING_FLUSH_ROWS, max_seconds=self.STAGING_FLUSH_SECONDS)
+        flusher = asyncio.ensure_future(
+            self._flush_staging_periodically(self._staging_writer))
 
-            if df is not None:
-                self.load(df, temp_table)
-                self.connection.update_url_scrape_status(
-                    pkey, "DONE", 'urls', now)
+        try:
+            if self.PIPELINE:
+                await self._scrape_product_infos_pipelined(df_urls)
+            elif self.MAX_CONCURRENT_PAGES > 1:
+                await self._scrape_product_infos_concurrently(df_urls)
+            elif self.PREFETCH_DEPTH > 0:
+                await self._scrape_product_infos_prefetching(df_urls)
             else:
-                self.connection.update_url_scrape_status(
-                    pkey, "FAILED", 'urls', now)
-
-            logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
+                for i, row in df_urls.iterrows():
+                    pkey = row["id"]
+                    url = row["url"]
+
+                    now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+                    soup = await self._scrape_product_info(url)
+                    await self._save_product_info(soup, pkey, url, now)
+
+                    logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
+        finally:
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+            # Also reached on cancellation (Ctrl-C, SIGTERM), so buffered rows are not lost
+            self._staging_writer.flush()
+            logger.info(f"[{self.SHOP}] {self._staging_writer.summary()}")
+            self._close_browser_session()
 
         for sql_file, label in [
             ('insert_into_pet_products.sql', 'data product inserted'),
@@ -92,7 +262,271 @@ class PetProductsETL(ABC):
 
         self._temp_table(f"DROP TABLE {temp_table};", temp_table, 'deleted')
 
+        logger.info(f"[{self.SHOP}] {self.resource_blocker.summary()}")
+        logger.info(f"[{self.SHOP}] {self.BEHAVIOR_POLICY.summary()}")
+        logger.info(f"[{self.SHOP}] {self.wait_stats.summary()}")
+        logger.info(
+            f"[{self.SHOP}] {block_stats.summary(site_key(self.BASE_URL))}")
+        if self.ASSET_CACHE_MB:
+            logger.info(
+                f"[{self.SHOP}] {self.browser_pool.asset_cache_stats.summary()}")
+
+    def _close_browser_session(self):
+        if self._browser_session is not None:
+            logger.info(f"[{self.SHOP}] {self._browser_session.summary()}")
+            self._browser_session.close()
+            self._browser_session = None
+
+    async def _scrape_product_info(self, url, polite=True):
+        min_sec, max_sec = (self.MIN_SEC_SLEEP_PRODUCT_INFO,
+                            self.MAX_SEC_SLEEP_PRODUCT_INFO) if polite else (0, 0)
+        return await self.scrape(
+            url, self.SELECTOR_SCRAPE_PRODUCT_INFO, min_sec=min_sec, max_sec=max_sec, wait_until=self.WAIT_UNTIL_PRODUCT_INFO,
+            extraction_script=self.EXTRACTION_SCRIPT, capture_scope=self.CAPTURE_SCOPE,
+            raw_html=self.TRANSFORM_PROCESS is not None, validate=self._transform_accepts)
+
+    async def _transform_accepts(self, page, url):
+        """Whether the shop's transform builds rows from ``page``, used to vet the HTTP tier before it is kept"""
+        return await self._transform_product_info(page, url) is not None
+
+    async def _transform_product_info(self, page, url):
+        """Run the shop's transform, in the worker processes if it has a TRANSFORM_PROCESS entry point"""
+        if self.TRANSFORM_PROCESS is None:
+            return await self.transform_async(page, url)
+
+        if not page:
+            logger.error(f"Error scraping {url}: no page content")
+            return None
+
+        loop = asyncio.get_running_loop()
+        try:
+            records = await loop.run_in_executor(
+                get_transform_pool(), self.TRANSFORM_PROCESS, page, url)
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            logger.error(f"Error transforming {url}: {e}")
+            return None
+
+        if records is None:
+            return None
+
+        df = pd.DataFrame.from_records(records)
+        df.insert(0, "shop", self.SHOP)
+        return df
+
+    async def _scrape_product_infos_concurrently(self, df_urls: pd.DataFrame):
+        """Fetch up to MAX_CONCURRENT_PAGES product pages at once and save them as they complete"""
+        self.browser_pool.ensure_capacity(self.MAX_CONCURRENT_PAGES)
+        pending = asyncio.Queue()
+        for _, row in df_urls.iterrows():
+            pending.put_nowait((row["id"], row["url"]))
+        fetched = asyncio.Queue(self.MAX_CONCURRENT_PAGES)
+
+        async def fetch():
+            while not pending.empty():
+                pkey, url = pending.get_nowait()
+                now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+                try:
+                    soup = await self._scrape_product_info(url)
+                except Exception as e:
+                    # Handed to the saver so the shop fails instead of waiting on this page
+                    await fetched.put(e)
+                    return
+                await fetched.put((pkey, url, soup, now))
+
+        workers = [asyncio.ensure_future(fetch())
+                   for _ in range(self.MAX_CONCURRENT_PAGES)]
+
+        logger.info(
+            f"Scraping {len(df_urls)} URL(s) with {self.MAX_CONCURRENT_PAGES} concurrent page(s)")
+
+        try:
+            for i in range(len(df_urls)):
+                item = await fetched.get()
+                if isinstance(item, Exception):
+                    raise item
+                pkey, url, soup, now = item
+                await self._save_product_info(soup, pkey, url, now)
+
+                logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
+        finally:
+            # A failed save must not leave workers navigating after the shop has given up
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _scrape_product_infos_prefetching(self, df_urls: pd.DataFrame):
+        """Fetch product pages in order, up to PREFETCH_DEPTH ahead of the page being saved"""
+        # One permit for the page being saved plus one per page fetched ahead of it
+        ahead = asyncio.Semaphore(self.PREFETCH_DEPTH + 1)
+        fetched = asyncio.Queue()
+
+        async def fetch_all():
+            try:
+                for _, row in df_urls.iterrows():
+                    await ahead.acquire()
+                    now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+                    soup = await self._scrape_product_info(row["url"], polite=False)
+                    await fetched.put((row["id"], row["url"], soup, now))
+                    # Same spacing between navigations as the sequential loop, without holding back the page
+                    await polite_sleep(self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
+            finally:
+                fetched.put_nowait(None)
+
+        fetcher = asyncio.ensure_future(fetch_all())
+        logger.info(
+            f"Scraping {len(df_urls)} URL(s) prefetching up to {self.PREFETCH_DEPTH} page(s) ahead")
+
+        try:
+            i = 0
+            while (item := await fetched.get()) is not None:
+                pkey, url, soup, now = item
+                await self._save_product_info(soup, pkey, url, now)
+                ahead.release()
+
+                i += 1
+                logger.info(f"{i} out of {len(df_urls)} URL(s) Scraped")
+
+            await fetcher
+        finally:
+            if not fetcher.done():
+                fetcher.cancel()
+                await asyncio.gather(fetcher, return_exceptions=True)
+
+    async def _scrape_product_infos_pipelined(self, df_urls: pd.DataFrame):
+        """Fetch, transform and load product pages in separate stages joined by bounded queues"""
+        fetch_workers = max(1, self.MAX_CONCURRENT_PAGES)
+        self.browser_pool.ensure_capacity(fetch_workers)
+
+        in_processes = self.TRANSFORM_PROCESS is not None
+        threaded = (not in_processes and self.TRANSFORM_WORKERS > 0
+                    and type(self).transform is not PetProductsETL.transform)
+        # Enough dispatchers to keep every worker process busy
+        transform_workers = TRANSFORM_PROCESSES if in_processes else max(1, self.TRANSFORM_WORKERS)
+        executor = ThreadPoolExecutor(
+            transform_workers, thread_name_prefix=f"{self.SHOP}-transform") if threaded else None
+
+        pending = asyncio.Queue()
+        for _, row in df_urls.iterrows():
+            pending.put_nowait((row["id"], row["url"]))
+        fetched = asyncio.Queue(self.PIPELINE_QUEUE_SIZE)
+        transformed = asyncio.Queue(self.PIPELINE_QUEUE_SIZE)
+
+        fetch_stats = StageStats("fetch", fetch_workers)
+        transform_stats = StageStats("transform", transform_workers)
+        load_stats = StageStats("load", 1)
+        stats = PipelineStats(fetch_stats, transform_stats, load_stats)
+
+        async def fetch():
+            while not pending.empty():
+                pkey, url = pending.get_nowait()
+                now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+                with fetch_stats.track("busy"):
+                    soup = await self._scrape_product_info(url, polite=False)
+                with fetch_stats.track("blocked"):
+                    await fetched.put((pkey, url, soup, now))
+                fetch_stats.items += 1
+                with fetch_stats.track("throttled"):
+                    await polite_sleep(self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
+
+        async def transform():
+            loop = asyncio.get_running_loop()
+            while True:
+                with transform_stats.track("starved"):
+                    item = await fetched.get()
+                if item is None:
+                    return
+                pkey, url, soup, now = item
+                with transform_stats.track("busy"):
+                    if executor is not None:
+                        df = await loop.run_in_executor(executor, self.transform, soup, url)
+                    else:
+                        df = await self._transform_product_info(soup, url)
+                with transform_stats.track("blocked"):
+                    await transformed.put((pkey, now, df))
+                transform_stats.items += 1
+
+        async def load():
+            done = False
+            while not done:
+                with load_stats.track("starved"):
+                    item = await transformed.get()
+                if item is None:
+                    return
+                # Everything already waiting is handed to the staging writer in one thread hop
+                batch = [item]
+                while not transformed.empty():
+                    item = transformed.get_nowait()
+                    if item is None:
+                        done = True
+                        break
+                    batch.append(item)
+                with load_stats.track("busy"):
+                    await asyncio.to_thread(self._load_product_infos, batch)
+                load_stats.items += len(batch)
+                logger.info(
+                    f"{load_stats.items} out of {len(df_urls)} URL(s) Scraped")
+
+        async def stage(workers, queue=None, consumers=0):
+            tasks = [asyncio.ensure_future(worker()) for worker in workers]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # gather leaves the other workers running when one fails, so a failed fetch must stop its siblings here
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            # One end marker per worker of the next stage
+            for _ in range(consumers):
+                await queue.put(None)
+
+        logger.info(
+            f"Scraping {len(df_urls)} URL(s) through a pipeline: {fetch_workers} fetch, "
+            f"{transform_workers} transform{' thread' if threaded else ' process' if in_processes else ''} worker(s)")
+
+        stages = [
+            asyncio.ensure_future(stage([fetch] * fetch_workers, fetched, transform_workers)),
+            asyncio.ensure_future(stage([transform] * transform_workers, transformed, 1)),
+            asyncio.ensure_future(stage([load])),
+        ]
+        try:
+            done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in stages:
+                task.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            stats.stop()
+            logger.info(f"[{self.SHOP}] {stats.summary()}")
+
+    def _load_product_infos(self, batch):
+        """Hand transformed products to the staging writer, which records each URL's status after its rows"""
+        for pkey, now, df in batch:
+            status = "DONE" if df is not None else "FAILED"
+            self._staging_writer.add(pkey, status, now, df)
+            self.scrape_counts[status] += 1
+
+    async def _save_product_info(self, soup, pkey, url, now):
+        df = await self._transform_product_info(soup, url)
+
+        # Database writes run off the loop so in-flight navigations keep progressing
+        await asyncio.to_thread(self._load_product_infos, [(pkey, now, df)])
+
+    async def _flush_staging_periodically(self, writer: StagingWriter):
+        """Flush rows that have waited STAGING_FLUSH_SECONDS while scraping goes on"""
+        while True:
+            await asyncio.sleep(writer.max_seconds / 2)
+            if writer.flush_due():
+                await asyncio.to_thread(writer.flush)
+
     def get_links_by_category(self):
+        asyncio.run(self.get_links_by_category_async())
+
+    async def get_links_by_category_async(self):
         self.connection.execute_query(
             f"DELETE FROM urls WHERE shop = '{self.SHOP}'")
 
@@ -128,21 +562,25 @@ class PetProductsETL(ABC):
         sql = sql.format(shop=self.SHOP, table_name=temp_url_table)
         df_urls = self.connection.extract_from_sql(sql)
 
-        for i, row in df_urls.iterrows():
-            pkey = row["id"]
-            url = row["url"]
-
-            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
-            df = self.extract(url)
-            if df is not None:
-                self.load(df, temp_table)
-                self.connection.update_url_scrape_status(
-                    pkey, "DONE", temp_url_table, now)
-            else:
-                self.connection.update_url_scrape_status(
-                    pkey, "FAILED", temp_url_table, now)
-
-            logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
+        try:
+            for i, row in df_urls.iterrows():
+                pkey = row["id"]
+                url = row["url"]
+
+                now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+                df = await self.extract_async(url)
+                if df is not None:
+                    self.load(df, temp_table)
+                    self.connection.update_url_scrape_status(
+                        pkey, "DONE", temp_url_table, now)
+                else:
+                    self.connection.update_url_scrape_status(
+                        pkey, "FAILED", temp_url_table, now)
+
+                logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
+        finally:
+            # Shops that call discover APIs through the browser session (Zooplus) warm it while extracting
+            self._close_browser_session()
 
         insert_url_from_temp_sql = self.connection.get_sql_from_file(
             'insert_into_urls.sql').format(table_name=temp_table)
@@ -0,0 +1,68 @@
+import os
+import asyncio
+import requests
+
+from typing import Optional, Dict
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+HTTP_TIMEOUT = 30
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+# Requests in flight at once across every shop and session of the process
+HTTP_MAX_CONCURRENT_REQUESTS = int(os.getenv("HTTP_MAX_CONCURRENT_REQUESTS", 10))
+
+_session: Optional[requests.Session] = None
+_request_slots: Optional[asyncio.Semaphore] = None
+_request_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def new_http_session() -> requests.Session:
+    """Create a session with a connection pool sized for concurrent scraping"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session"""
+    global _session
+
+    if _session is None:
+        _session = new_http_session()
+
+    return _session
+
+
+def http_request_slots() -> asyncio.Semaphore:
+    """Semaphore every outgoing HTTP request holds, capping concurrent requests process-wide"""
+    global _request_slots, _request_slots_loop
+
+    loop = asyncio.get_running_loop()
+    if _request_slots is None or _request_slots_loop is not loop:
+        _request_slots = asyncio.Semaphore(HTTP_MAX_CONCURRENT_REQUESTS)
+        _request_slots_loop = loop
+
+    return _request_slots
+
+
+async def http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = HTTP_TIMEOUT, **kwargs) -> requests.Response:
+    """Run a pooled GET request without blocking the event loop"""
+    async with http_request_slots():
+        return await asyncio.to_thread(
+            get_http_session().get, url, headers=headers, timeout=timeout, **kwargs)
+
+
+def close_http_session() -> None:
+    global _session
+
+    if _session is not None:
+        try:
+            _session.close()
+        except Exception as e:
+            logger.error(f"Error closing HTTP session: {e}")
+        finally:
+            _session = None
@@ -0,0 +1,75 @@
+import random
+
+from typing import Optional, Dict, Any
+
+FIREFOX_VERSIONS = ("128.0", "139.0", "140.0", "141.0")
+
+
+class IdentityProfile:
+    """A consistent browser identity: user agent, platform, locale and screen that belong together.
+
+    A profile is bound to a browser context for the context's whole life, so
+    every request from that context tells the same story. Profiles only
+    describe Firefox because that is the engine the pool runs, which also
+    means no Sec-Ch-Ua client hints: Firefox does not send them.
+    """
+
+    def __init__(self, user_agent: str, viewport: Dict[str, int], locale: str = "en-GB", timezone_id: str = "Europe/London", accept_language: str = "en-GB,en;q=0.5"):
+        self.user_agent = user_agent
+        self.viewport = viewport
+        self.locale = locale
+        self.timezone_id = timezone_id
+        self.accept_language = accept_language
+
+    def context_options(self) -> Dict[str, Any]:
+        return {
+            "user_agent": self.user_agent,
+            "viewport": self.viewport,
+            "locale": self.locale,
+            "timezone_id": self.timezone_id,
+        }
+
+    def headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Navigation headers Firefox sends with this identity, updated with ``headers``"""
+        default_headers = {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate, br, zstd",
+            "Accept-Language": self.accept_language,
+            "User-Agent": self.user_agent,
+            "Priority": "u=0, i",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "same-origin",
+            "Sec-Fetch-User": "?1"
+        }
+
+        if headers:
+            default_headers.update(headers)
+
+        return default_headers
+
+
+def _build_profiles():
+    platforms = [
+        ("Windows NT 10.0; Win64; x64", [{"width": 1920, "height": 1080}, {"width": 1536, "height": 864}, {"width": 1366, "height": 768}]),
+        ("Macintosh; Intel Mac OS X 10.15", [{"width": 1440, "height": 900}, {"width": 1680, "height": 1050}]),
+        ("X11; Linux x86_64", [{"width": 1920, "height": 1080}]),
+        ("X11; Ubuntu; Linux x86_64", [{"width": 1600, "height": 900}]),
+    ]
+
+    profiles = []
+    for platform, viewports in platforms:
+        for version in FIREFOX_VERSIONS:
+            user_agent = f"Mozilla/5.0 ({platform}; rv:{version}) Gecko/20100101 Firefox/{version}"
+            for viewport in viewports:
+                profiles.append(IdentityProfile(user_agent, viewport))
+    return tuple(profiles)
+
+
+# Built once at import, picking a profile costs nothing
+IDENTITY_PROFILES = _build_profiles()
+
+
+def random_profile() -> IdentityProfile:
+    return random.choice(IDENTITY_PROFILES)
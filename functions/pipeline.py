@@ -0,0 +1,106 @@
+import os
+import time
+import multiprocessing
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Optional
+from loguru import logger
+
+# Worker processes shared by every shop that transforms product pages out of process
+TRANSFORM_PROCESSES = int(os.getenv("TRANSFORM_PROCESSES", os.cpu_count() or 1))
+
+_transform_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_transform_pool() -> ProcessPoolExecutor:
+    """Return the process-wide pool that runs picklable transform entry points"""
+    global _transform_pool
+
+    if _transform_pool is None:
+        # Spawned rather than forked: a fork would copy the Playwright driver's threads mid-flight
+        _transform_pool = ProcessPoolExecutor(
+            TRANSFORM_PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"Started {TRANSFORM_PROCESSES} transform worker process(es)")
+
+    return _transform_pool
+
+
+def close_transform_pool() -> None:
+    global _transform_pool
+
+    if _transform_pool is not None:
+        try:
+            _transform_pool.shutdown(cancel_futures=True)
+        except Exception as e:
+            logger.error(f"Error closing transform pool: {e}")
+        finally:
+            _transform_pool = None
+
+
+class StageStats:
+    """Where the workers of one pipeline stage spend their time.
+
+    ``busy`` is time doing the stage's work, ``starved`` is time waiting for
+    input from the stage before, ``blocked`` is time waiting for room in the
+    queue to the stage after and ``throttled`` is time spent in politeness
+    delays. Shares are relative to the pipeline's wall time across all of
+    the stage's workers.
+    """
+
+    STATES = ("busy", "starved", "blocked", "throttled")
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.times = Counter()
+
+    @contextmanager
+    def track(self, state: str):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.times[state] += time.monotonic() - started
+
+    def share(self, state: str, elapsed: float) -> float:
+        capacity = elapsed * self.workers
+        return self.times[state] / capacity if capacity else 0.0
+
+    def summary(self, elapsed: float) -> str:
+        shares = ", ".join(
+            f"{state} {self.share(state, elapsed):.0%}" for state in self.STATES if self.times[state])
+        return f"{self.name}: {self.items} item(s), {self.workers} worker(s), {shares or 'idle'}"
+
+
+class PipelineStats:
+    """Utilisation of every stage of one pipeline run, naming the stage that limits throughput"""
+
+    def __init__(self, *stages: StageStats):
+        self.stages = stages
+        self.started = time.monotonic()
+        self.ended: Optional[float] = None
+
+    def stop(self) -> None:
+        self.ended = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.ended or time.monotonic()) - self.started
+
+    def bottleneck(self) -> Optional[StageStats]:
+        """The stage whose workers were busy for the largest share of the run"""
+        elapsed = self.elapsed
+        busiest = max(self.stages, key=lambda stage: stage.share("busy", elapsed), default=None)
+        if busiest is None or not busiest.times["busy"]:
+            return None
+        return busiest
+
+    def summary(self) -> str:
+        elapsed = self.elapsed
+        stages = "; ".join(stage.summary(elapsed) for stage in self.stages)
+        bottleneck = self.bottleneck()
+        limit = f", bottleneck: {bottleneck.name}" if bottleneck else ""
+        return f"Pipeline ({elapsed:.1f}s): {stages}{limit}"
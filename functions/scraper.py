@@ -1,20 +1,34 @@
+import os
+import re
+import json
+import time
 import random
 import asyncio
-import nest_asyncio
+import requests
 
-from typing import Optional, Dict, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from fake_useragent import UserAgent
+from collections import Counter
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from typing import Optional, Dict, Any, List, AsyncIterator, Union, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Route, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
-    before_sleep_log
+    before_sleep_log,
+    RetryCallState
 )
+from tenacity.stop import stop_base
+from tenacity.wait import wait_base
 from loguru import logger
-nest_asyncio.apply()
+from .http_client import http_get, http_request_slots, new_http_session, HTTP_TIMEOUT
+from .identity import IdentityProfile, random_profile
 
 MAX_RETRIES = 5
 MAX_WAIT_BETWEEN_REQ = 5
@@ -22,6 +36,32 @@ MIN_WAIT_BETWEEN_REQ = 2
 REQUEST_TIMEOUT = 60000
 PAGE_LOAD_TIMEOUT = 60000
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STORAGE_STATE_DIR = os.getenv(
+    "STORAGE_STATE_DIR", os.path.join(BASE_DIR, ".cache", "storage_state"))
+STORAGE_STATE_TTL = 6 * 60 * 60
+# Root of the per-shop, per-worker browser profiles used in asset cache mode
+ASSET_CACHE_DIR = os.getenv(
+    "ASSET_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "assets"))
+
+# Total attempts allowed per kind of scraping error
+RETRY_BUDGETS = {
+    "timeout": 2,
+    "blocked": 1,
+    "server_error": 3,
+    "rate_limited": 4,
+    "selector_missing": 2,
+    "crashed": 3,
+    "unknown": MAX_RETRIES,
+}
+MAX_RETRY_AFTER = 300
+
+# Error kinds that say something about the health of the whole site
+CIRCUIT_BREAKER_ERROR_KINDS = {"timeout", "blocked", "server_error", "rate_limited"}
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 300
+CIRCUIT_BREAKER_MAX_TRIPS = 3
+
 
 class SkipScrape(Exception):
     """Raised to indicate that scraping should be skipped (e.g. 404)."""
@@ -29,103 +69,1531 @@ class SkipScrape(Exception):
 
 
 class ScrapingError(Exception):
-    """General scraping error that should trigger retries"""
+    """General scraping error that should trigger retries.
+
+    ``kind`` picks the retry budget from RETRY_BUDGETS and ``retry_after``
+    (seconds) overrides the backoff when the server asked for it.
+    """
+
+    def __init__(self, message: str = "", kind: str = "unknown", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.kind = kind
+        self.retry_after = retry_after
+
+
+class BlockedError(ScrapingError):
+    """The shop answered with a challenge or block page instead of content"""
+
+    def __init__(self, message: str = "", reason: str = ""):
+        super().__init__(message, kind="blocked")
+        self.reason = reason
+
+
+class CircuitOpenError(SkipScrape):
+    """Raised without touching the network while a shop's circuit breaker is open."""
     pass
 
 
-class WebScraper:
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given as seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def classify_response(response: Response, url: str) -> None:
+    """Raise the exception matching an HTTP error status"""
+    status = response.status
+    if status == 429:
+        raise ScrapingError(
+            f"HTTP 429 rate limited for {url}", kind="rate_limited",
+            retry_after=parse_retry_after(response.headers.get("retry-after")))
+    if status == 403:
+        raise BlockedError(f"HTTP 403 blocked for {url}", reason="HTTP 403")
+    if status >= 500:
+        raise ScrapingError(
+            f"HTTP {status} server error for {url}", kind="server_error",
+            retry_after=parse_retry_after(response.headers.get("retry-after")))
+    if status >= 400:
+        raise SkipScrape(f"HTTP {status} error for {url}")
+
+
+def _is_crash_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return "crash" in message or "has been closed" in message
+
+
+class stop_by_error_kind(stop_base):
+    """Stop once the attempt budget for the kind of the last error is used up"""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        exception = retry_state.outcome.exception()
+        kind = getattr(exception, "kind", "unknown")
+        return retry_state.attempt_number >= RETRY_BUDGETS.get(kind, MAX_RETRIES)
+
+
+class wait_retry_after(wait_base):
+    """Honour Retry-After when the error carries one, else fall back to ``fallback``"""
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception()
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER)
+        return self.fallback(retry_state)
+
+
+class CircuitBreaker:
+    """Pauses a shop after a run of consecutive site-level failures.
+
+    After ``threshold`` failures in a row the shop's circuit opens and every
+    request to it waits out the cooldown, which doubles with each trip. The
+    first request after the pause is a trial: a success closes the circuit,
+    a failure trips it again. After ``max_trips`` trips without a success,
+    requests to the shop fail fast with CircuitOpenError.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD, cooldown: float = CIRCUIT_BREAKER_COOLDOWN, max_trips: int = CIRCUIT_BREAKER_MAX_TRIPS):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self._failures: Counter = Counter()
+        self._trips: Counter = Counter()
+        self._open_until: Dict[str, float] = {}
+
+    def is_open(self, site: str) -> bool:
+        return site in self._open_until
+
+    async def before_request(self, site: str) -> None:
+        if not self.is_open(site):
+            return
+
+        if self._trips[site] >= self.max_trips:
+            raise CircuitOpenError(
+                f"Circuit open for {site} after {self._trips[site]} trip(s), skipping")
+
+        remaining = self._open_until[site] - time.monotonic()
+        if remaining > 0:
+            logger.warning(
+                f"Circuit open for {site}, pausing {remaining:.0f} sec")
+            await asyncio.sleep(remaining)
+
+    def record_success(self, site: str) -> None:
+        if self.is_open(site):
+            logger.info(f"Circuit closed for {site}")
+        self._failures.pop(site, None)
+        self._trips.pop(site, None)
+        self._open_until.pop(site, None)
+
+    def record_failure(self, site: str, kind: str) -> None:
+        if kind not in CIRCUIT_BREAKER_ERROR_KINDS:
+            return
+
+        self._failures[site] += 1
+        # A failed trial while half-open trips the circuit straight away
+        if self._failures[site] >= self.threshold or self.is_open(site):
+            self._trips[site] += 1
+            self._failures[site] = 0
+            cooldown = self.cooldown * 2 ** (self._trips[site] - 1)
+            self._open_until[site] = time.monotonic() + cooldown
+            logger.warning(
+                f"Circuit opened for {site} after repeated {kind} errors (trip {self._trips[site]}, cooldown {cooldown:.0f} sec)")
+
+
+circuit_breaker = CircuitBreaker()
+
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", 1))
+CONTEXTS_PER_BROWSER = int(os.getenv("CONTEXTS_PER_BROWSER", 2))
+# Upper bound on contexts (open pages) a pool grows to when shops ask for more concurrency
+MAX_POOL_CONTEXTS = int(os.getenv("MAX_POOL_CONTEXTS", 8))
+MAX_PAGES_PER_CONTEXT = 50
+
+# Resident memory of the Playwright driver and browsers, sampled every MEMORY_CHECK_INTERVAL sec.
+# Past the soft limit contexts are drained and replaced, past the hard limit browsers are restarted.
+MEMORY_CHECK_INTERVAL = 30
+MEMORY_SOFT_LIMIT_MB = int(os.getenv("BROWSER_MEMORY_SOFT_LIMIT_MB", 1500))
+MEMORY_HARD_LIMIT_MB = int(os.getenv("BROWSER_MEMORY_HARD_LIMIT_MB", 2500))
+
+BROWSER_ARGS = {
+    "headless": True,
+    "args": [
+        # Basic security and sandbox
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+
+        # Memory optimization
+        "--memory-pressure-off",
+        "--disable-gpu",
+        "--disable-gpu-compositing",
+        "--disable-gpu-rasterization",
+        "--disable-gpu-sandbox",
+
+        # Background process optimization
+        "--disable-background-timer-throttling",
+        "--disable-background-networking",
+        "--disable-backgrounding-occluded-windows",
+
+        # Disable unnecessary features
+        "--disable-extensions",
+        "--disable-plugins",
+        # Don't load images (major memory saver)
+        "--disable-images",
+        "--disable-javascript-harmony-shipping",
+        "--disable-webgl",
+        "--disable-webrtc",
+
+        # Cache and storage optimization
+        "--disk-cache-size=0",
+        "--media-cache-size=0",
+        "--disable-application-cache",
+        "--disable-offline-load-stale-cache",
+
+        # Audio/Video (not needed for scraping)
+        "--disable-audio-output",
+        "--mute-audio",
+        "--disable-video",
+
+        # Rendering optimization
+        "--disable-smooth-scrolling",
+        "--disable-animations",
+    ]
+}
+
+
+def asset_cache_prefs(size_mb: int) -> Dict[str, Any]:
+    """Firefox prefs for a size-capped disk cache; images stay off since nothing parses them"""
+    return {
+        "browser.cache.disk.enable": True,
+        "browser.cache.disk.smart_size.enabled": False,
+        "browser.cache.disk.capacity": size_mb * 1024,
+        "permissions.default.image": 2,
+    }
+
+
+# Sizes and durations of the resources the page loaded, from the Resource Timing API
+RESOURCE_TIMING_SCRIPT = """
+() => performance.getEntriesByType("resource").map((e) => ({
+    type: e.initiatorType,
+    transfer: e.transferSize,
+    encoded: e.encodedBodySize,
+    decoded: e.decodedBodySize,
+    duration: e.duration,
+}))
+"""
+
+
+class AssetCacheStats:
+    """Counts static assets served from the browser's disk cache, from the Resource Timing API.
+
+    An entry with a body but no bytes transferred came from the cache. Bytes
+    saved are the encoded sizes of those hits and time saved is the gap
+    between the mean miss and mean hit duration. Cross-origin entries
+    without Timing-Allow-Origin report no sizes and are left out.
+    """
+
     def __init__(self):
-        self.ua = UserAgent()
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
+        self.hits = 0
+        self.misses = 0
+        self.hits_by_type: Counter = Counter()
+        self.bytes_saved = 0
+        self.hit_time = 0.0
+        self.miss_time = 0.0
+
+    def record(self, entries: List[Dict[str, Any]]) -> None:
+        for entry in entries:
+            if not entry.get("decoded"):
+                continue
+            if entry.get("transfer") == 0:
+                self.hits += 1
+                self.hits_by_type[entry.get("type")] += 1
+                self.bytes_saved += entry.get("encoded") or 0
+                self.hit_time += entry.get("duration") or 0
+            else:
+                self.misses += 1
+                self.miss_time += entry.get("duration") or 0
+
+    async def record_page(self, page: Page) -> None:
+        try:
+            self.record(await page.evaluate(RESOURCE_TIMING_SCRIPT))
+        except Exception as e:
+            logger.debug(f"Could not read resource timings: {e}")
+
+    @property
+    def time_saved(self) -> float:
+        """Estimated seconds saved by cache hits"""
+        if not self.hits or not self.misses:
+            return 0.0
+        per_hit = self.miss_time / self.misses - self.hit_time / self.hits
+        return max(0.0, per_hit * self.hits) / 1000
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0
+        return (
+            f"Asset cache: {self.hits} hit(s), {self.misses} miss(es) ({hit_rate:.0%}), "
+            f"~{self.bytes_saved / 1_000_000:.1f} MB and ~{self.time_saved:.1f} sec saved "
+            f"(hits by type: {dict(self.hits_by_type)})")
+
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+DEFAULT_BLOCKED_DOMAINS = (
+    # Analytics
+    "google-analytics.com",
+    "googletagmanager.com",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.io",
+    "newrelic.com",
+    "nr-data.net",
+    # Ad tags
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "criteo.com",
+    "criteo.net",
+    "bing.com",
+    "tiktok.com",
+    "pinterest.com",
+    "awin1.com",
+)
+
+REVIEW_WIDGET_DOMAINS = (
+    "trustpilot.com",
+    "feefo.com",
+    "okendo.io",
+    "bazaarvoice.com",
+    "reviews.io",
+    "yotpo.com",
+)
+
+# Typical transfer size of a blocked request, used to estimate bandwidth saved
+ESTIMATED_RESOURCE_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 50_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+DEFAULT_ESTIMATED_RESOURCE_BYTES = 10_000
+
+
+class ResourceBlocker:
+    """Aborts page requests by resource type or by domain and counts what was saved.
+
+    Firefox ignores Chromium switches such as ``--disable-images``, so blocking
+    is done at the route level instead. One blocker is kept per shop so its
+    counters cover the whole run.
+    """
+
+    def __init__(self, resource_types=DEFAULT_BLOCKED_RESOURCE_TYPES, domains=DEFAULT_BLOCKED_DOMAINS):
+        self.resource_types = set(resource_types or ())
+        self.domains = tuple(domains or ())
+        self.blocked_by_type: Counter = Counter()
+        self.blocked_by_domain: Counter = Counter()
+        self.allowed_requests = 0
+        self.estimated_bytes_saved = 0
+
+    def _blocked_domain(self, url: str) -> Optional[str]:
+        host = urlparse(url).hostname or ""
+        for domain in self.domains:
+            if host == domain or host.endswith("." + domain):
+                return domain
+        return None
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.resource_types:
+            self.blocked_by_type[resource_type] += 1
+        else:
+            domain = self._blocked_domain(url)
+            if domain is None:
+                self.allowed_requests += 1
+                return False
+            self.blocked_by_domain[domain] += 1
+
+        self.estimated_bytes_saved += ESTIMATED_RESOURCE_BYTES.get(
+            resource_type, DEFAULT_ESTIMATED_RESOURCE_BYTES)
+        return True
+
+    async def handle(self, route: Route) -> None:
+        request = route.request
+        try:
+            if self.should_block(request.resource_type, request.url):
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception as e:
+            # The page may already be closing
+            logger.debug(f"Route handling failed for {request.url}: {e}")
+
+    async def attach(self, page: Page) -> None:
+        if self.resource_types or self.domains:
+            await page.route("**/*", self.handle)
+
+    @property
+    def blocked_requests(self) -> int:
+        return sum(self.blocked_by_type.values()) + sum(self.blocked_by_domain.values())
+
+    def summary(self) -> str:
+        return (
+            f"Blocked {self.blocked_requests} request(s), allowed {self.allowed_requests}, "
+            f"~{self.estimated_bytes_saved / 1_000_000:.1f} MB saved "
+            f"(by type: {dict(self.blocked_by_type)}, by domain: {dict(self.blocked_by_domain)})"
+        )
+
+
+# Returns the target container plus the head metadata and structured-data scripts
+SCOPED_CAPTURE_SCRIPT = """
+(selector) => {
+    const target = selector ? document.querySelector(selector) : null;
+    const outside = (el) => !target || !target.contains(el);
+    const metadata = Array.from(document.querySelectorAll(
+        "head title, head meta, head link[rel='canonical'], "
+        + "script[type*='application/ld+json'], script#__NEXT_DATA__"
+    )).filter(outside).map((el) => el.outerHTML);
+    return {
+        head: metadata.join(""),
+        body: target ? target.outerHTML : ""
+    };
+}
+"""
+
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+))?(?P<classes>(?:\.[\w-]+)*)$")
+
+
+class ScopeFilter(ElementFilter):
+    """Keeps only the element matching a simple CSS selector plus head metadata while parsing.
+
+    Only top-level tags are filtered by BeautifulSoup, so everything inside an
+    accepted tag is kept as usual.
+    """
+
+    METADATA_TAGS = {"title", "meta"}
+
+    def __init__(self, tag: Optional[str], element_id: Optional[str], classes: List[str]):
+        self.tag = tag
+        self.element_id = element_id
+        self.classes = set(classes)
+
+    @classmethod
+    def from_selector(cls, selector: str) -> Optional["ScopeFilter"]:
+        """Build a filter for ``tag``, ``#id`` and ``.class`` selectors; None for anything else"""
+        match = _SIMPLE_SELECTOR.match(selector.strip()) if selector else None
+        if not match or not any(match.groups()):
+            return None
+
+        classes = [c for c in match.group("classes").split(".") if c]
+        return cls(match.group("tag"), match.group("id"), classes)
+
+    def _is_metadata(self, name: str, attrs: Dict[str, Any]) -> bool:
+        if name in self.METADATA_TAGS:
+            return True
+        if name == "link":
+            return "canonical" in str(attrs.get("rel") or "")
+        if name == "script":
+            return "ld+json" in str(attrs.get("type") or "") or attrs.get("id") == "__NEXT_DATA__"
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        if self._is_metadata(name, attrs):
+            return True
+        if self.tag and name != self.tag:
+            return False
+        if self.element_id and attrs.get("id") != self.element_id:
+            return False
+        if self.classes and not self.classes <= set(str(attrs.get("class") or "").split()):
+            return False
+        return True
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+
+def parse_scoped_html(html: str, selector: str) -> BeautifulSoup:
+    """Parse only the part of ``html`` that ``selector`` and the head metadata need"""
+    return BeautifulSoup(html, "html.parser", parse_only=ScopeFilter.from_selector(selector))
+
+
+SUSPICIOUS_TITLE_MARKERS = (
+    "just a moment",
+    "checking your browser",
+    "access denied",
+    "attention required",
+    "are you a robot",
+    "verify you are human",
+    "pardon our interruption",
+    "captcha",
+)
 
-    def get_headers(self, headers=None) -> Dict[str, str]:
-        """Generate realistic browser headers"""
-
-        default_headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Cache-Control": "max-age=0",
-            "User-Agent": self.ua.random,
-            "Priority": "u=0, i",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Ch-Ua": '"Not.A/Brand";v="24", "Opera GX";v="118", "Chromium";v="134"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "same-origin",
-            "Sec-Fetch-User": "?1"
+# JavaScript interstitials that may clear themselves; every other marker is a hard block
+SOFT_CHALLENGE_MARKERS = ("just a moment", "checking your browser")
+
+# Markup only challenge pages carry
+CHALLENGE_SELECTORS = (
+    "#challenge-form",
+    "#challenge-running",
+    "#cf-challenge-running",
+    ".cf-browser-verification",
+    "#px-captcha",
+    "iframe[src*='captcha-delivery.com']",
+    "div[id^='sec-if-cpt']",
+)
+
+# Captcha widgets that shop pages also embed for login, newsletter and review forms.
+# They only mean a block when the product selector never shows up
+CAPTCHA_WIDGET_SELECTORS = (
+    "iframe[src*='hcaptcha.com']",
+    "iframe[src*='recaptcha']",
+)
+
+# An HTML document smaller than this is a challenge stub, not a shop page
+BLOCK_PAGE_MAX_BYTES = 1024
+
+# Error statuses anti-bot vendors answer with; any other 4xx is a dead link
+BLOCK_STATUSES = (403, 429)
+
+# Polling interval of the in-page challenge watcher while waiting for the product selector
+BLOCK_CHECK_INTERVAL = 250
+
+# Returns the first challenge marker found in the current document, or null
+BLOCK_PAGE_SCRIPT = """
+([titleMarkers, selectors]) => {
+    const title = (document.title || "").toLowerCase();
+    const marker = titleMarkers.find((m) => title.includes(m));
+    if (marker) {
+        return marker;
+    }
+    const selector = selectors.find((s) => document.querySelector(s));
+    return selector || null;
+}
+"""
+
+
+def detect_block_response(response: Response) -> Optional[str]:
+    """Challenge signals in the navigation response itself: anti-bot headers and stub documents"""
+    headers = response.headers
+    if headers.get("cf-mitigated") == "challenge":
+        return "cf-mitigated header"
+    if headers.get("x-amzn-waf-action") in ("captcha", "challenge"):
+        return "x-amzn-waf-action header"
+    # Only a success or a block status can be a stub: error pages of dead links are small too
+    status = response.status
+    if not (200 <= status < 300 or status in BLOCK_STATUSES):
+        return None
+    if "x-datadome" in headers and status in BLOCK_STATUSES:
+        return "datadome response"
+
+    content_length = headers.get("content-length")
+    if ("text/html" in headers.get("content-type", "") and content_length
+            and content_length.isdigit() and int(content_length) < BLOCK_PAGE_MAX_BYTES):
+        return f"{content_length} byte document"
+
+    return None
+
+
+async def detect_block_page(page: Page) -> Optional[str]:
+    """Cheap in-page check of the title and known challenge markup"""
+    try:
+        return await page.evaluate(
+            BLOCK_PAGE_SCRIPT, [list(SUSPICIOUS_TITLE_MARKERS), list(CHALLENGE_SELECTORS)])
+    except Exception:
+        return None
+
+
+async def detect_captcha_widget(page: Page) -> Optional[str]:
+    """The captcha widget on a page whose product selector never appeared, if any"""
+    try:
+        return await page.evaluate(BLOCK_PAGE_SCRIPT, [[], list(CAPTCHA_WIDGET_SELECTORS)])
+    except Exception:
+        return None
+
+
+class BlockStats:
+    """Block and challenge pages seen per site, by detector reason"""
+
+    def __init__(self):
+        self.blocks: Dict[str, Counter] = {}
+
+    def record(self, site: str, reason: str) -> None:
+        self.blocks.setdefault(site, Counter())[reason] += 1
+
+    def count(self, site: str) -> int:
+        return sum(self.blocks.get(site, Counter()).values())
+
+    def summary(self, site: str) -> str:
+        reasons = self.blocks.get(site, Counter())
+        return f"Block pages: {sum(reasons.values())} ({dict(reasons)})"
+
+
+block_stats = BlockStats()
+
+
+class BehaviorPolicy:
+    """Decides on which pages human behaviour is simulated and tracks the time it costs.
+
+    Modes:
+        always: every page (the historical behaviour).
+        never: no page.
+        sampled: a random ``sample_rate`` share of pages.
+        on_suspicion: only pages that look like a block or challenge page.
+
+    Once ``budget_seconds`` of simulation has been spent in a run, only
+    suspicious pages are simulated.
+    """
+
+    MODES = ("always", "never", "sampled", "on_suspicion")
+
+    def __init__(self, mode: str = "always", sample_rate: float = 0.1, budget_seconds: Optional[float] = None):
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Behavior policy mode must be one of {self.MODES}, got '{mode}'")
+
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.budget_seconds = budget_seconds
+        self.time_spent = 0.0
+        self.pages_simulated = 0
+        self.pages_skipped = 0
+
+    @property
+    def checks_suspicion(self) -> bool:
+        return self.mode != "never"
+
+    def should_simulate(self, suspicious: bool = False) -> bool:
+        if self.mode == "never":
+            simulate = False
+        elif suspicious:
+            simulate = True
+        elif self.budget_seconds is not None and self.time_spent >= self.budget_seconds:
+            simulate = False
+        elif self.mode == "always":
+            simulate = True
+        elif self.mode == "sampled":
+            simulate = random.random() < self.sample_rate
+        else:
+            simulate = False
+
+        if not simulate:
+            self.pages_skipped += 1
+        return simulate
+
+    def record(self, elapsed: float) -> None:
+        self.time_spent += elapsed
+        self.pages_simulated += 1
+
+    def summary(self) -> str:
+        return (
+            f"Behavior simulation ({self.mode}): {self.pages_simulated} page(s) simulated, "
+            f"{self.pages_skipped} skipped, {self.time_spent:.1f} sec spent"
+        )
+
+
+class WaitStats:
+    """Per-shop timings of the adaptive "selector" wait compared with waiting for the load event.
+
+    Every ``baseline_every``-th adaptive page lets the load event finish so the
+    time saved on the other pages can be estimated against a real baseline.
+    Pages navigated with ``wait_until="load"`` also feed the baseline.
+    """
+
+    def __init__(self, baseline_every: int = 25):
+        self.baseline_every = baseline_every
+        self.adaptive_pages = 0
+        self.load_first = 0
+        self.cut_pages = 0
+        self.cut_selector_time = 0.0
+        self.load_samples = 0
+        self.load_time = 0.0
+
+    def should_measure_load(self) -> bool:
+        return bool(self.baseline_every) and self.adaptive_pages % self.baseline_every == 0
+
+    def record_load(self, elapsed: float) -> None:
+        self.load_samples += 1
+        self.load_time += elapsed
+
+    def record_adaptive(self, selector_elapsed: float, load_elapsed: Optional[float] = None, load_first: bool = False) -> None:
+        self.adaptive_pages += 1
+        if load_first:
+            self.load_first += 1
+        if load_elapsed is not None:
+            self.record_load(load_elapsed)
+        else:
+            self.cut_pages += 1
+            self.cut_selector_time += selector_elapsed
+
+    @property
+    def estimated_time_saved(self) -> Optional[float]:
+        if not self.load_samples:
+            return None
+        average_load = self.load_time / self.load_samples
+        return max(0.0, average_load * self.cut_pages - self.cut_selector_time)
+
+    def summary(self) -> str:
+        summary = (
+            f"Adaptive wait: {self.adaptive_pages} page(s), {self.cut_pages} returned before load, "
+            f"{self.load_first} where load came first"
+        )
+        if self.cut_pages:
+            summary += f", avg time to selector {self.cut_selector_time / self.cut_pages:.2f} sec"
+        if self.load_samples:
+            summary += (
+                f", avg time to load {self.load_time / self.load_samples:.2f} sec "
+                f"({self.load_samples} sample(s)), ~{self.estimated_time_saved:.1f} sec saved"
+            )
+        return summary
+
+
+def site_key(url: str) -> str:
+    """Host of ``url`` without a leading www., used to key per-shop caches"""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _belongs_to_site(host: str, site: str) -> bool:
+    host = host.lstrip(".").lower()
+    return host == site or host.endswith("." + site) or site.endswith("." + host)
+
+
+# Restores the cached localStorage of the current origin before any page script runs
+_LOCAL_STORAGE_INIT_SCRIPT = """
+(origins => {
+    const entry = origins.find((o) => o.origin === window.location.origin);
+    if (!entry) return;
+    for (const item of entry.localStorage) {
+        try { window.localStorage.setItem(item.name, item.value); } catch (e) {}
+    }
+})(%s)
+"""
+
+
+class StorageStateCache:
+    """Per-shop Playwright storage state (cookies and localStorage) persisted on disk.
+
+    The state of a shop is saved after its first successful navigation, so
+    later contexts skip consent walls, geo redirects and anti-bot challenges.
+    Entries expire after ``ttl`` seconds and are dropped when a block page is seen.
+    """
+
+    def __init__(self, directory: str = STORAGE_STATE_DIR, ttl: float = STORAGE_STATE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        # Avoids re-reading the file on every page once a site is known to be fresh
+        self._fresh_until: Dict[str, float] = {}
+
+    def _path(self, site: str) -> str:
+        return os.path.join(self.directory, f"{site}.json")
+
+    def load(self, site: str) -> Optional[Dict[str, Any]]:
+        path = self._path(site)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable storage state {path}: {e}")
+            return None
+
+        if time.time() - entry.get("saved_at", 0) > self.ttl:
+            logger.info(f"Storage state for {site} expired")
+            self.invalidate(site)
+            return None
+
+        self._fresh_until[site] = entry.get("saved_at", 0) + self.ttl
+        return entry.get("state")
+
+    def is_fresh(self, site: str) -> bool:
+        if time.time() < self._fresh_until.get(site, 0):
+            return True
+        return self.load(site) is not None
+
+    def save(self, site: str, state: Dict[str, Any]) -> None:
+        state = {
+            "cookies": [c for c in state.get("cookies", [])
+                        if _belongs_to_site(c.get("domain", ""), site)],
+            "origins": [o for o in state.get("origins", [])
+                        if _belongs_to_site(urlparse(o.get("origin", "")).hostname or "", site)],
         }
 
-        if headers:
-            default_headers.update(headers)
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(site)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"saved_at": time.time(), "state": state}, f)
+        os.replace(tmp_path, path)
+        self._fresh_until[site] = time.time() + self.ttl
+        logger.info(
+            f"Saved storage state for {site} ({len(state['cookies'])} cookie(s))")
 
-        return default_headers
+    def invalidate(self, site: str) -> None:
+        self._fresh_until.pop(site, None)
+        try:
+            os.remove(self._path(site))
+            logger.info(f"Invalidated storage state for {site}")
+        except FileNotFoundError:
+            pass
 
-    async def setup_browser(self) -> None:
-        """Initialize browser and context"""
-        if self.browser is None:
-            playwright = await async_playwright().start()
-
-            browser_args = {
-                "headless": True,
-                "args": [
-                    # Basic security and sandbox
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-
-                    # Memory optimization
-                    "--memory-pressure-off",
-                    "--disable-gpu",
-                    "--disable-gpu-compositing",
-                    "--disable-gpu-rasterization",
-                    "--disable-gpu-sandbox",
-
-                    # Background process optimization
-                    "--disable-background-timer-throttling",
-                    "--disable-background-networking",
-                    "--disable-backgrounding-occluded-windows",
-
-                    # Disable unnecessary features
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    # Don't load images (major memory saver)
-                    "--disable-images",
-                    "--disable-javascript-harmony-shipping",
-                    "--disable-webgl",
-                    "--disable-webrtc",
-
-                    # Cache and storage optimization
-                    "--disk-cache-size=0",
-                    "--media-cache-size=0",
-                    "--disable-application-cache",
-                    "--disable-offline-load-stale-cache",
-
-                    # Audio/Video (not needed for scraping)
-                    "--disable-audio-output",
-                    "--mute-audio",
-                    "--disable-video",
-
-                    # Rendering optimization
-                    "--disable-smooth-scrolling",
-                    "--disable-animations",
-                ]
-            }
 
-            self.browser = await playwright.firefox.launch(**browser_args)
+class _ContextSlot:
+    """A single browser context owned by the pool and lent to one page at a time."""
+
+    def __init__(self, browser_index: int, worker_id: int):
+        self.browser_index = browser_index
+        # Stable per slot, names the slot's profile directory in asset cache mode
+        self.worker_id = worker_id
+        self.context: Optional[BrowserContext] = None
+        self.pages_served = 0
+        self.crashed = False
+        # Identity every page of the current context presents
+        self.profile: Optional[IdentityProfile] = None
+        # Reason the context must be replaced once its page is returned, if any
+        self.retire: Optional[str] = None
+        # Sites whose cached storage state was loaded into this context
+        self.storage_sites = set()
+
+
+# Command names of this process's children that root a browser subtree (the Playwright driver, or a browser)
+BROWSER_PROCESS_NAMES = ("node", "firefox")
+
+
+def browser_processes_rss() -> Optional[int]:
+    """Resident bytes of the Playwright driver and browser processes below this one, None without /proc.
+
+    Other children, such as transform or shop worker processes and the
+    multiprocessing resource tracker, are python processes and not counted.
+    """
+    try:
+        pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return None
+
+    children: Dict[int, List[int]] = {}
+    names: Dict[int, str] = {}
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # The command name may contain spaces, the parent pid follows its closing parenthesis
+                name, rest = f.read().split("(", 1)[1].rsplit(")", 1)
+                ppid = int(rest.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(pid)
+        names[pid] = name
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = [pid for pid in children.get(os.getpid(), [])
+             if names.get(pid, "").startswith(BROWSER_PROCESS_NAMES)]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+
+    return total
+
+
+class MemoryWatchdog:
+    """Samples browser memory and asks the pool to drain contexts or restart browsers past the limits"""
+
+    def __init__(self, pool: "BrowserPool", soft_limit_mb: int = MEMORY_SOFT_LIMIT_MB, hard_limit_mb: int = MEMORY_HARD_LIMIT_MB, interval: float = MEMORY_CHECK_INTERVAL):
+        self.pool = pool
+        self.soft_limit = soft_limit_mb * 2**20
+        self.hard_limit = hard_limit_mb * 2**20
+        self.interval = interval
+        self.samples = 0
+        self.high_water = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if browser_processes_rss() is None:
+            logger.info("Process memory is not readable here, memory watchdog disabled")
+            return
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.warning(f"Memory watchdog check failed: {e}")
+
+    async def check(self) -> None:
+        rss = browser_processes_rss()
+        if rss is None:
+            return
+
+        self.samples += 1
+        self.high_water = max(self.high_water, rss)
+        logger.debug(
+            f"Browser RSS {rss / 2**20:.0f} MB, {len(self.pool._borrowed)} open page(s)")
+
+        if rss >= self.hard_limit:
+            logger.warning(
+                f"Browser RSS {rss / 2**20:.0f} MB over hard limit, restarting browsers")
+            await self.pool.restart_browsers("memory")
+        elif rss >= self.soft_limit:
+            logger.warning(
+                f"Browser RSS {rss / 2**20:.0f} MB over soft limit, replacing contexts")
+            await self.pool.retire_contexts("memory")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def summary(self) -> str:
+        return f"browser RSS high-water {self.high_water / 2**20:.0f} MB over {self.samples} sample(s)"
+
+
+class BrowserPool:
+    """Keeps browsers and contexts warm for a whole run and hands out pages.
+
+    Each of the ``n_browsers`` browsers owns ``contexts_per_browser`` contexts.
+    A context is lent to one page at a time and is recycled after
+    ``max_pages_per_context`` pages or as soon as its page or browser crashes.
+    With ``watch_memory`` a MemoryWatchdog also drains contexts or restarts
+    browsers when their resident memory grows past the configured limits.
+
+    With ``asset_cache_dir`` every slot instead runs a persistent context in
+    its own profile directory below it, keeping a disk cache of at most
+    ``asset_cache_mb`` so static assets are downloaded once per worker.
+    Route interception turns Playwright's HTTP cache off, so these pools
+    skip request blocking and only keep images off through a pref.
+    """
 
-        if self.context is None:
+    def __init__(
+        self,
+        n_browsers: int = BROWSER_POOL_SIZE,
+        contexts_per_browser: int = CONTEXTS_PER_BROWSER,
+        max_pages_per_context: int = MAX_PAGES_PER_CONTEXT,
+        storage_cache: Optional[StorageStateCache] = None,
+        watch_memory: bool = False,
+        asset_cache_dir: Optional[str] = None,
+        asset_cache_mb: int = 0,
+    ):
+        self.n_browsers = n_browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.max_pages_per_context = max_pages_per_context
+        self.playwright: Optional[Playwright] = None
+        self.browsers: List[Optional[Browser]] = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Queue] = None
+        self._all_slots: List[_ContextSlot] = []
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._borrowed: Dict[int, _ContextSlot] = {}
+        self.storage_cache = storage_cache
+        self.watchdog = MemoryWatchdog(self) if watch_memory else None
+        self.asset_cache_dir = asset_cache_dir
+        self.asset_cache_mb = asset_cache_mb
+        self.asset_cache_stats = AssetCacheStats() if asset_cache_dir else None
+        self.pages_served = 0
+        self.recycle_events: Counter = Counter()
+        self.browser_restarts: Counter = Counter()
+        # Browsers to close once all their contexts are drained, with the reason
+        self._browsers_to_restart: Dict[int, str] = {}
+        # Replaced browsers still serving pages from old contexts, closed with their last context
+        self._draining_browsers: Dict[Browser, str] = {}
+
+    @property
+    def size(self) -> int:
+        return self.n_browsers * self.contexts_per_browser
+
+    @property
+    def caches_assets(self) -> bool:
+        return self.asset_cache_dir is not None
+
+    def ensure_capacity(self, n_contexts: int) -> None:
+        """Grow the pool so that at least ``n_contexts`` pages can be open at once, up to MAX_POOL_CONTEXTS"""
+        if n_contexts > MAX_POOL_CONTEXTS:
+            logger.warning(
+                f"{n_contexts} concurrent pages requested, capped at {MAX_POOL_CONTEXTS}")
+        while self.size < n_contexts and self.size + self.n_browsers <= MAX_POOL_CONTEXTS:
+            self.contexts_per_browser += 1
+            if self._slots is not None:
+                for browser_index in range(self.n_browsers):
+                    slot = _ContextSlot(browser_index, len(self._all_slots))
+                    self._all_slots.append(slot)
+                    self._slots.put_nowait(slot)
+
+    async def start(self) -> None:
+        """Start Playwright and launch the browsers (idempotent)"""
+        if self._slots is not None:
+            return
+
+        self.loop = asyncio.get_running_loop()
+        self._browser_lock = asyncio.Lock()
+        self.playwright = await async_playwright().start()
+        self.browsers = [None] * self.n_browsers
+
+        self._slots = asyncio.Queue()
+        self._all_slots = []
+        for browser_index in range(self.n_browsers):
+            for _ in range(self.contexts_per_browser):
+                slot = _ContextSlot(browser_index, len(self._all_slots))
+                self._all_slots.append(slot)
+                self._slots.put_nowait(slot)
+
+        if self.watchdog is not None:
+            self.watchdog.start()
+
+        logger.info(
+            f"Browser pool started ({self.n_browsers} browser(s) x {self.contexts_per_browser} context(s))")
+
+    async def _get_browser(self, browser_index: int) -> Browser:
+        async with self._browser_lock:
+            browser = self.browsers[browser_index]
+            if browser_index in self._browsers_to_restart:
+                # New contexts go to a fresh browser; the old one closes once its last context is recycled
+                reason = self._browsers_to_restart.pop(browser_index)
+                if browser is not None and browser.is_connected():
+                    self._draining_browsers[browser] = reason
+                browser = None
+                self.browsers[browser_index] = None
+            if browser is None or not browser.is_connected():
+                if browser is not None:
+                    logger.warning(
+                        f"Browser {browser_index} disconnected, relaunching...")
+                    self.browser_restarts["crash"] += 1
+                browser = await self.playwright.firefox.launch(**BROWSER_ARGS)
+                self.browsers[browser_index] = browser
+            return browser
+
+    async def _ensure_persistent_context(self, slot: _ContextSlot) -> BrowserContext:
+        if slot.context is None:
+            profile = random_profile()
+            user_data_dir = os.path.join(
+                self.asset_cache_dir, f"worker-{slot.worker_id}")
+            os.makedirs(user_data_dir, exist_ok=True)
+            slot.context = await self.playwright.firefox.launch_persistent_context(
+                user_data_dir,
+                **BROWSER_ARGS,
+                **profile.context_options(),
+                java_script_enabled=True,
+                ignore_https_errors=True,
+                firefox_user_prefs=asset_cache_prefs(self.asset_cache_mb),
+            )
+            slot.profile = profile
+            slot.pages_served = 0
+            slot.crashed = False
+            slot.retire = None
+            slot.storage_sites = set()
+
+            def mark_crashed(_):
+                slot.crashed = True
+
+            # A persistent context closes together with its browser
+            slot.context.on("close", mark_crashed)
+
+        return slot.context
+
+    async def _ensure_context(self, slot: _ContextSlot) -> BrowserContext:
+        if self.caches_assets:
+            return await self._ensure_persistent_context(slot)
+
+        browser = await self._get_browser(slot.browser_index)
+
+        if slot.context is not None and slot.context.browser is not browser:
+            # The browser behind this context was relaunched or is being restarted
+            slot.retire = slot.retire or "browser restart"
+            await self._recycle(slot)
+
+        if slot.context is None:
+            # A new context is a new visitor, so it is the only place the identity changes
+            profile = random_profile()
             context_options = {
-                "locale": "en-US",
-                "user_agent": self.ua.random,
-                "viewport": {"width": 1920, "height": 1080},
+                **profile.context_options(),
                 "java_script_enabled": True,
                 "ignore_https_errors": True
             }
+            slot.context = await browser.new_context(**context_options)
+            slot.profile = profile
+            slot.pages_served = 0
+            slot.crashed = False
+            slot.retire = None
+            slot.storage_sites = set()
+
+        return slot.context
+
+    async def _apply_storage_state(self, slot: _ContextSlot, site: str) -> None:
+        if self.storage_cache is None or site in slot.storage_sites:
+            return
+
+        slot.storage_sites.add(site)
+        state = self.storage_cache.load(site)
+        if not state:
+            return
+
+        if state.get("cookies"):
+            await slot.context.add_cookies(state["cookies"])
+        if state.get("origins"):
+            await slot.context.add_init_script(
+                _LOCAL_STORAGE_INIT_SCRIPT % json.dumps(state["origins"]))
+        logger.info(f"Loaded cached storage state for {site}")
+
+    async def save_storage_state(self, page: Page, url: str) -> None:
+        """Persist the shop's cookies after a successful navigation if the cache has none"""
+        site = site_key(url)
+        if self.storage_cache is None or self.storage_cache.is_fresh(site):
+            return
+        try:
+            self.storage_cache.save(site, await page.context.storage_state())
+        except Exception as e:
+            logger.warning(f"Could not save storage state for {site}: {e}")
+
+    def profile_for(self, page: Page) -> IdentityProfile:
+        """Identity of the context a borrowed page belongs to"""
+        return self._borrowed[id(page)].profile
+
+    def forget_storage_state(self, url: str) -> None:
+        """Drop the cached state of a shop, keeping the contexts that loaded it"""
+        if self.storage_cache is not None:
+            self.storage_cache.invalidate(site_key(url))
+
+    def invalidate_storage_state(self, page: Page, url: str) -> None:
+        """Drop the cached state of a shop that served a block page and retire the context"""
+        self.forget_storage_state(url)
+        slot = self._borrowed.get(id(page))
+        if slot is not None:
+            slot.retire = "block page"
+
+    async def _recycle(self, slot: _ContextSlot) -> None:
+        if slot.crashed:
+            reason = "crash"
+        elif slot.retire:
+            reason = slot.retire
+        else:
+            reason = "page limit"
+        logger.info(
+            f"Recycling browser context after {reason} ({slot.pages_served} pages)")
+        self.recycle_events[reason] += 1
+        browser = slot.context.browser if slot.context else None
+        try:
+            if slot.context:
+                if self.caches_assets and reason == "block page":
+                    # The profile directory outlives the context, the flagged cookies must not
+                    await slot.context.clear_cookies()
+                await slot.context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+        finally:
+            slot.context = None
+            slot.pages_served = 0
+            slot.crashed = False
+            slot.retire = None
+            slot.storage_sites = set()
+
+        if browser in self._draining_browsers and not self._has_contexts(browser):
+            await self._close_restarted_browser(
+                browser, self._draining_browsers.pop(browser))
+        elif slot.browser_index in self._browsers_to_restart:
+            await self._restart_browser_if_drained(slot.browser_index)
+
+    async def retire_contexts(self, reason: str) -> None:
+        """Replace idle contexts now and busy ones as soon as their page is returned"""
+        if self._slots is None:
+            return
+
+        # Taking the idle slots out of the queue keeps them from being lent while they close
+        idle = []
+        while not self._slots.empty():
+            idle.append(self._slots.get_nowait())
+
+        for slot in self._all_slots:
+            if slot.context is not None and not slot.retire:
+                slot.retire = reason
+
+        try:
+            for slot in idle:
+                if slot.context is not None:
+                    await self._recycle(slot)
+        finally:
+            for slot in idle:
+                self._slots.put_nowait(slot)
+
+    async def restart_browsers(self, reason: str) -> None:
+        """Replace every browser: new pages get a fresh one, the old one closes when drained"""
+        for browser_index, browser in enumerate(self.browsers):
+            if browser is not None:
+                self._browsers_to_restart[browser_index] = reason
+        await self.retire_contexts(reason)
+
+        # Browsers left without any context are closed right away
+        for browser_index in list(self._browsers_to_restart):
+            await self._restart_browser_if_drained(browser_index)
+
+    def _has_contexts(self, browser: Browser) -> bool:
+        return any(slot.context is not None and slot.context.browser is browser for slot in self._all_slots)
+
+    async def _restart_browser_if_drained(self, browser_index: int) -> None:
+        async with self._browser_lock:
+            browser = self.browsers[browser_index]
+            if browser_index not in self._browsers_to_restart or (browser is not None and self._has_contexts(browser)):
+                return
+            reason = self._browsers_to_restart.pop(browser_index)
+            self.browsers[browser_index] = None
+
+        if browser is not None:
+            await self._close_restarted_browser(browser, reason)
+
+    async def _close_restarted_browser(self, browser: Browser, reason: str) -> None:
+        logger.info(f"Restarting browser after {reason}")
+        self.browser_restarts[reason] += 1
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+
+    def summary(self) -> str:
+        recycles = ", ".join(
+            f"{reason}: {n}" for reason, n in self.recycle_events.most_common()) or "none"
+        restarts = ", ".join(
+            f"{reason}: {n}" for reason, n in self.browser_restarts.most_common()) or "none"
+        summary = (
+            f"Browser pool: {self.pages_served} page(s) served, "
+            f"context recycles ({recycles}), browser restarts ({restarts})")
+        if self.watchdog is not None and self.watchdog.samples:
+            summary += f", {self.watchdog.summary()}"
+        return summary
+
+    @asynccontextmanager
+    async def page(self, url: Optional[str] = None) -> AsyncIterator[Page]:
+        """Borrow a fresh page from a pooled context, primed with the cached state of ``url``'s shop"""
+        await self.start()
+
+        slot = await self._slots.get()
+        page = None
+        try:
+            context = await self._ensure_context(slot)
+            try:
+                page = await context.new_page()
+            except Exception as e:
+                logger.warning(f"Failed to open page, recycling context: {e}")
+                slot.crashed = True
+                await self._recycle(slot)
+                context = await self._ensure_context(slot)
+                page = await context.new_page()
+
+            slot.pages_served += 1
+            self.pages_served += 1
+            self._borrowed[id(page)] = slot
+
+            def mark_crashed(_):
+                slot.crashed = True
+
+            page.on("crash", mark_crashed)
+
+            if url:
+                await self._apply_storage_state(slot, site_key(url))
+
+            yield page
+
+        finally:
+            if page:
+                if self.asset_cache_stats is not None:
+                    await self.asset_cache_stats.record_page(page)
+                self._borrowed.pop(id(page), None)
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.error(f"Error closing page: {e}")
+
+            browser = self.browsers[slot.browser_index] if self.browsers else None
+            if browser is not None and not browser.is_connected():
+                slot.crashed = True
+
+            if slot.crashed or slot.retire or slot.pages_served >= self.max_pages_per_context:
+                await self._recycle(slot)
+
+            self._slots.put_nowait(slot)
+
+    async def close(self) -> None:
+        """Clean up every pooled context, browser and the Playwright driver"""
+        if self.watchdog is not None:
+            await self.watchdog.stop()
+        if self._slots is not None:
+            logger.info(self.summary())
+
+        try:
+            for slot in self._all_slots:
+                if slot.context:
+                    await slot.context.close()
+            for browser in [*self.browsers, *self._draining_browsers]:
+                if browser:
+                    await browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser pool: {e}")
+        finally:
+            self.playwright = None
+            self.browsers = []
+            self._browsers_to_restart = {}
+            self._draining_browsers = {}
+            self._slots = None
+            self._all_slots = []
+            self.loop = None
+
+
+# The shared pool under None, plus one asset-caching pool per shop that asks for it, for each event loop.
+# Playwright objects are bound to the loop that created them, so a loop never borrows another loop's pool
+_browser_pools: Dict[Tuple[Optional[str], asyncio.AbstractEventLoop], BrowserPool] = {}
+
+
+def get_browser_pool(shop: Optional[str] = None, asset_cache_mb: int = 0) -> BrowserPool:
+    """Return this event loop's shared browser pool, or ``shop``'s own asset-caching pool if ``asset_cache_mb`` is set"""
+    key = shop if shop and asset_cache_mb else None
+
+    loop = asyncio.get_running_loop()
+    pool = _browser_pools.get((key, loop))
+
+    if pool is None:
+        if any(pool_loop is not loop for _, pool_loop in _browser_pools):
+            logger.warning(
+                "Starting a browser pool for another event loop; close_browser_pool() must run before that loop ends")
+        if key is None:
+            pool = BrowserPool(
+                storage_cache=StorageStateCache(), watch_memory=True)
+        else:
+            pool = BrowserPool(
+                storage_cache=StorageStateCache(), watch_memory=True,
+                asset_cache_dir=os.path.join(ASSET_CACHE_DIR, key.lower()), asset_cache_mb=asset_cache_mb)
+        _browser_pools[(key, loop)] = pool
+
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down every browser pool at the end of a run, each on the event loop it belongs to"""
+    loop = asyncio.get_running_loop()
+    while _browser_pools:
+        (_, pool_loop), pool = _browser_pools.popitem()
+        try:
+            if pool_loop is loop:
+                await pool.close()
+            elif pool_loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(pool.close(), pool_loop))
+            elif not pool_loop.is_closed():
+                await asyncio.to_thread(pool_loop.run_until_complete, pool.close())
+            else:
+                logger.error(
+                    "Browser pool outlived its event loop, its browsers could not be closed")
+        except Exception as e:
+            logger.error(f"Error closing browser pool: {e}")
+
+
+@asynccontextmanager
+async def open_page(
+    url: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    viewport: Optional[Dict[str, int]] = None,
+    resource_blocker: Optional[ResourceBlocker] = None,
+    pool: Optional[BrowserPool] = None,
+) -> AsyncIterator[Page]:
+    """Borrow a page from the shared browser pool for custom interactions.
+
+    The page gets its context's identity headers merged with ``headers``,
+    the given ``viewport`` and the shop's blocking rules. It is closed and its
+    context slot returned to the pool on exit, so shop helpers that scroll
+    or click through listings share browsers with every other scrape.
+    """
+    pool = pool or get_browser_pool()
+    async with pool.page(url) as page:
+        page.set_default_timeout(REQUEST_TIMEOUT)
+        page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
+
+        if viewport:
+            await page.set_viewport_size(viewport)
+
+        if resource_blocker and not pool.caches_assets:
+            await resource_blocker.attach(page)
+
+        await page.set_extra_http_headers(pool.profile_for(page).headers(headers))
+
+        yield page
+
+
+async def capture_json_responses(
+    url: str,
+    patterns: List[str],
+    max_responses: int = 1,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = REQUEST_TIMEOUT,
+    resource_blocker: Optional[ResourceBlocker] = None,
+    viewport: Optional[Dict[str, int]] = None,
+    pool: Optional[BrowserPool] = None,
+) -> List[Dict[str, Any]]:
+    """Navigate to ``url`` and collect the JSON bodies of responses whose URL matches ``patterns``.
+
+    ``patterns`` are regular expressions searched in each response URL.
+    Returns ``{"url": ..., "data": ...}`` dicts in arrival order and stops
+    as soon as ``max_responses`` are captured, without waiting for the rest
+    of the page. On timeout whatever was captured so far is returned.
+    """
+    compiled = [re.compile(pattern) for pattern in patterns]
+    captured: List[Dict[str, Any]] = []
+    enough = asyncio.Event()
+    reads = set()
+
+    async def read(response: Response) -> None:
+        try:
+            data = await response.json()
+        except Exception as e:
+            logger.debug(f"Could not parse JSON from {response.url}: {e}")
+            return
+        if not enough.is_set():
+            logger.info(f"Captured JSON from: {response.url}")
+            captured.append({"url": response.url, "data": data})
+            if len(captured) >= max_responses:
+                enough.set()
 
-            self.context = await self.browser.new_context(**context_options)
+    def on_response(response: Response) -> None:
+        if enough.is_set() or response.status != 200:
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        if any(pattern.search(response.url) for pattern in compiled):
+            reads.add(asyncio.ensure_future(read(response)))
+
+    async with open_page(url, headers, viewport, resource_blocker, pool) as page:
+        page.on("response", on_response)
+        try:
+            logger.info(f"Navigating to: {url}")
+            await page.goto(url, wait_until="commit", timeout=PAGE_LOAD_TIMEOUT)
+            await asyncio.wait_for(enough.wait(), timeout / 1000)
+        except (asyncio.TimeoutError, PlaywrightTimeoutError):
+            logger.warning(
+                f"Captured {len(captured)}/{max_responses} JSON responses from {url} before timeout")
+        finally:
+            page.remove_listener("response", on_response)
+            for task in reads:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*reads, return_exceptions=True)
+
+    return captured
+
+
+class BrowserSession:
+    """Plain HTTP client that borrows the identity of a warmed browser context.
+
+    Shops whose JSON endpoints only need the cookies a real browser earns
+    load ``warm_url`` once in a pooled page, then send every later request
+    over HTTP with that page's cookies and user agent. A 403 means the
+    cookies went stale, so the session re-warms and retries once.
+    """
+
+    def __init__(self, warm_url: str, selector: Optional[str] = None, headers: Optional[Dict[str, str]] = None, resource_blocker: Optional[ResourceBlocker] = None, pool: Optional[BrowserPool] = None):
+        self.warm_url = warm_url
+        self.selector = selector
+        self.headers = headers
+        self.resource_blocker = resource_blocker
+        self.pool = pool
+        self.site = site_key(warm_url)
+        self.session: Optional[requests.Session] = None
+        self.profile: Optional[IdentityProfile] = None
+        self.warm_count = 0
+        self.requests_made = 0
+        self._lock = asyncio.Lock()
+
+    async def warm(self, stale_generation: int) -> None:
+        """Load ``warm_url`` in the browser and export its cookies into a fresh HTTP session"""
+        async with self._lock:
+            if self.session is not None and stale_generation != self.warm_count:
+                # Another request already re-warmed while this one waited
+                return
+
+            logger.info(f"Warming browser session for {self.site}: {self.warm_url}")
+            pool = self.pool or get_browser_pool()
+            async with open_page(self.warm_url, self.headers, resource_blocker=self.resource_blocker, pool=pool) as page:
+                await page.goto(self.warm_url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
+                if self.selector:
+                    await page.wait_for_selector(self.selector)
+                self.profile = pool.profile_for(page)
+                cookies = await page.context.cookies()
+
+            session = new_http_session()
+            for cookie in cookies:
+                if _belongs_to_site(cookie["domain"], self.site):
+                    session.cookies.set(
+                        cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+
+            if self.session is not None:
+                self.session.close()
+            self.session = session
+            self.warm_count += 1
+
+    async def _get(self, url: str, headers: Optional[Dict[str, str]], timeout: int, **kwargs) -> requests.Response:
+        http_headers = self.profile.headers(headers)
+        # The cookies are only valid for the user agent that earned them
+        http_headers["User-Agent"] = self.profile.user_agent
+        http_headers["Accept-Encoding"] = "gzip, deflate"
+        self.requests_made += 1
+        async with http_request_slots():
+            return await asyncio.to_thread(
+                self.session.get, url, headers=http_headers, timeout=timeout, **kwargs)
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: int = HTTP_TIMEOUT, **kwargs) -> requests.Response:
+        if self.session is None:
+            await self.warm(self.warm_count)
+
+        generation = self.warm_count
+        response = await self._get(url, headers, timeout, **kwargs)
+        if response.status_code == 403:
+            logger.warning(f"HTTP 403 from {url}, re-warming browser session for {self.site}")
+            await self.warm(generation)
+            response = await self._get(url, headers, timeout, **kwargs)
+
+        return response
+
+    def summary(self) -> str:
+        return f"Browser session: {self.requests_made} HTTP request(s) on {self.warm_count} browser warm-up(s)"
+
+    def close(self) -> None:
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+
+class WebScraper:
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        # A scraper without a shared pool gets a private single-context one
+        self._owns_pool = pool is None
+        self.pool = pool or BrowserPool(n_browsers=1, contexts_per_browser=1)
+
+    def get_headers(self, page: Page, headers=None) -> Dict[str, str]:
+        """Browser headers matching the identity of ``page``'s context"""
+        return self.pool.profile_for(page).headers(headers)
+
+    async def setup_browser(self) -> None:
+        """Initialize the browser pool"""
+        await self.pool.start()
 
     async def simulate_human_behavior(self, page: Page) -> None:
         try:
@@ -154,6 +1622,116 @@ class WebScraper:
         except Exception as e:
             logger.warning(f"Error during behavior simulation: {e}")
 
+    async def _simulate_with_policy(self, page: Page, behavior_policy: Optional[BehaviorPolicy], suspicious: bool = False) -> None:
+        if behavior_policy is None:
+            logger.info("Simulating human behavior...")
+            await self.simulate_human_behavior(page)
+            return
+
+        if behavior_policy.should_simulate(suspicious):
+            logger.info("Simulating human behavior...")
+            started = time.monotonic()
+            await self.simulate_human_behavior(page)
+            behavior_policy.record(time.monotonic() - started)
+
+    async def _wait_for_selector_or_load(
+        self,
+        page: Page,
+        selector: str,
+        timeout: int,
+        navigation_started: float,
+        wait_stats: Optional[WaitStats] = None,
+    ) -> None:
+        """Return as soon as ``selector`` appears and stop the rest of the page load"""
+        selector_task = asyncio.ensure_future(
+            page.wait_for_selector(selector, timeout=timeout))
+        load_task = asyncio.ensure_future(
+            page.wait_for_load_state("load", timeout=timeout))
+
+        try:
+            done, _ = await asyncio.wait(
+                {selector_task, load_task}, return_when=asyncio.FIRST_COMPLETED)
+
+            if selector_task not in done:
+                # Load finished (or timed out) first, the selector is still the readiness contract
+                load_ok = load_task.exception() is None
+                load_elapsed = time.monotonic() - navigation_started
+                await selector_task
+                selector_elapsed = time.monotonic() - navigation_started
+                if wait_stats:
+                    wait_stats.record_adaptive(
+                        selector_elapsed, load_elapsed if load_ok else None, load_first=True)
+                return
+
+            selector_task.result()
+            selector_elapsed = time.monotonic() - navigation_started
+
+            if wait_stats and wait_stats.should_measure_load():
+                try:
+                    await load_task
+                    wait_stats.record_adaptive(
+                        selector_elapsed, time.monotonic() - navigation_started)
+                except Exception:
+                    wait_stats.record_adaptive(selector_elapsed)
+                return
+
+            load_task.cancel()
+            try:
+                await page.evaluate("window.stop()")
+            except Exception as e:
+                logger.debug(f"Could not stop page load: {e}")
+
+            if wait_stats:
+                wait_stats.record_adaptive(selector_elapsed)
+
+        finally:
+            for task in (selector_task, load_task):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(selector_task, load_task, return_exceptions=True)
+
+    def _raise_blocked(self, page: Page, url: str, reason: str) -> None:
+        # Cached cookies may be what got us flagged
+        self.pool.invalidate_storage_state(page, url)
+        raise BlockedError(f"Block page ({reason}) for {url}", reason=reason)
+
+    async def _on_block_page(self, page: Page, url: str, reason: str, simulate_behavior: bool, behavior_policy: Optional[BehaviorPolicy]) -> None:
+        """Fail fast on a block page, unless it is an interstitial that clears after acting human"""
+        logger.warning(f"Page looks like a block page ({reason}): {url}")
+        if reason in SOFT_CHALLENGE_MARKERS and simulate_behavior and behavior_policy and behavior_policy.checks_suspicion:
+            await self._simulate_with_policy(page, behavior_policy, suspicious=True)
+            if not await detect_block_page(page):
+                logger.info(f"Challenge cleared on {url}")
+                # The cached state was challenged, the context now holds the clearance cookies
+                self.pool.forget_storage_state(url)
+                await self.pool.save_storage_state(page, url)
+                return
+        self._raise_blocked(page, url, reason)
+
+    async def _wait_unless_blocked(self, page: Page, wait) -> Optional[str]:
+        """Await ``wait`` while watching for challenge markup; return the marker if one shows up first"""
+        wait_task = asyncio.ensure_future(wait)
+        watch_task = asyncio.ensure_future(page.wait_for_function(
+            BLOCK_PAGE_SCRIPT, arg=[list(SUSPICIOUS_TITLE_MARKERS), list(CHALLENGE_SELECTORS)],
+            polling=BLOCK_CHECK_INTERVAL, timeout=0))
+
+        try:
+            done, _ = await asyncio.wait(
+                {wait_task, watch_task}, return_when=asyncio.FIRST_COMPLETED)
+            if wait_task in done:
+                wait_task.result()
+                return None
+            if watch_task.exception() is not None:
+                # The watcher broke (e.g. navigation), keep waiting for the selector alone
+                await wait_task
+                return None
+            return await watch_task.result().json_value()
+        finally:
+            for task in (wait_task, watch_task):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(wait_task, watch_task, return_exceptions=True)
+
     async def _extract_scrape_content(
         self,
         url: str,
@@ -162,72 +1740,136 @@ class WebScraper:
         wait_until: str = "domcontentloaded",
         simulate_behavior: bool = True,
         headers: Optional[Dict[str, str]] = None,
-    ) -> BeautifulSoup:
+        resource_blocker: Optional[ResourceBlocker] = None,
+        extraction_script: Optional[str] = None,
+        capture_scope: str = "document",
+        behavior_policy: Optional[BehaviorPolicy] = None,
+        wait_stats: Optional[WaitStats] = None,
+        raw_html: bool = False,
+    ) -> Union[BeautifulSoup, Dict[str, Any], str]:
 
-        page = None
         try:
-            await self.setup_browser()
+            async with self.pool.page(url) as page:
+                page.set_default_timeout(timeout)
+                page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
 
-            if not self.context:
-                raise ScrapingError("Failed to initialize browser context")
+                if resource_blocker and not self.pool.caches_assets:
+                    await resource_blocker.attach(page)
 
-            page = await self.context.new_page()
+                await page.set_extra_http_headers(self.get_headers(page, headers))
 
-            page.set_default_timeout(timeout)
-            page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
+                logger.info(f"Navigating to: {url}")
 
-            await page.set_extra_http_headers(self.get_headers(headers))
+                # "selector" navigates until commit and then races the selector against the load event
+                adaptive_wait = wait_until == "selector"
+                valid_wait_until = {
+                    "load", "domcontentloaded", "networkidle", "commit"}
+                if not adaptive_wait and wait_until not in valid_wait_until:
+                    logger.warning(
+                        f"Invalid wait_until '{wait_until}', defaulting to 'domcontentloaded'")
+                    wait_until = "domcontentloaded"
 
-            logger.info(f"Navigating to: {url}")
+                navigation_started = time.monotonic()
+                try:
+                    response = await page.goto(
+                        url, wait_until="commit" if adaptive_wait else wait_until, timeout=PAGE_LOAD_TIMEOUT)
+                except PlaywrightTimeoutError as e:
+                    raise ScrapingError(
+                        f"Timeout navigating to {url}: {e}", kind="timeout")
 
-            valid_wait_until = {
-                "load", "domcontentloaded", "networkidle", "commit"}
-            if wait_until not in valid_wait_until:
-                logger.warning(
-                    f"Invalid wait_until '{wait_until}', defaulting to 'domcontentloaded'")
-                wait_until = "domcontentloaded"
+                if wait_stats and wait_until == "load":
+                    wait_stats.record_load(time.monotonic() - navigation_started)
 
-            response = await page.goto(url, wait_until=wait_until, timeout=PAGE_LOAD_TIMEOUT)
+                if not response:
+                    raise ScrapingError(f"No response received for {url}")
 
-            if not response:
-                raise ScrapingError(f"No response received for {url}")
+                # A dead link is skipped before the detector can mistake its small error page for a block
+                if 400 <= response.status < 500 and response.status not in BLOCK_STATUSES:
+                    classify_response(response, url)
 
-            if response.status >= 400:
-                raise SkipScrape(f"HTTP {response.status} error for {url}")
+                block_reason = detect_block_response(response)
+                if block_reason:
+                    self._raise_blocked(page, url, block_reason)
 
-            logger.info(f"Waiting for selector: {selector}")
-            await page.wait_for_selector(selector, timeout=timeout)
+                classify_response(response, url)
 
-            if simulate_behavior:
-                logger.info("Simulating human behavior...")
-                await self.simulate_human_behavior(page)
+                suspicious = False
+                block_reason = await detect_block_page(page)
+                if block_reason:
+                    await self._on_block_page(page, url, block_reason, simulate_behavior, behavior_policy)
+                    suspicious = True
 
-            logger.info("Extracting page content...")
-            rendered_html = await page.content()
+                logger.info(f"Waiting for selector: {selector}")
+                try:
+                    if adaptive_wait:
+                        wait = self._wait_for_selector_or_load(
+                            page, selector, timeout, navigation_started, wait_stats)
+                    else:
+                        wait = page.wait_for_selector(selector, timeout=timeout)
+
+                    block_reason = await self._wait_unless_blocked(page, wait)
+                    if block_reason:
+                        await self._on_block_page(page, url, block_reason, simulate_behavior, behavior_policy)
+                        suspicious = True
+                        await page.wait_for_selector(selector, timeout=timeout)
+                except PlaywrightTimeoutError as e:
+                    if not suspicious:
+                        block_reason = await detect_captcha_widget(page)
+                        if block_reason:
+                            logger.warning(
+                                f"Product selector missing behind a captcha ({block_reason}): {url}")
+                            self._raise_blocked(page, url, block_reason)
+                    raise ScrapingError(
+                        f"Timeout waiting for selector '{selector}' on {url}: {e}",
+                        kind="blocked" if suspicious else "selector_missing")
+
+                if simulate_behavior and not suspicious:
+                    await self._simulate_with_policy(page, behavior_policy)
+
+                if not suspicious:
+                    await self.pool.save_storage_state(page, url)
+
+                if extraction_script:
+                    logger.info("Extracting fields in the browser...")
+                    data = await page.evaluate(extraction_script)
+                    if not data:
+                        # Like a missing selector: the page lacks what the script reads, a refetch rarely helps
+                        raise ScrapingError(
+                            f"Extraction script returned no data for {url}", kind="selector_missing")
+                    logger.success(f"Successfully extracted fields from {url}")
+                    return data
+
+                if capture_scope == "selector":
+                    logger.info("Extracting selector content...")
+                    fragment = await page.evaluate(SCOPED_CAPTURE_SCRIPT, selector)
+                    rendered_html = f"<head>{fragment['head']}</head><body>{fragment['body']}</body>"
+                else:
+                    logger.info("Extracting page content...")
+                    rendered_html = await page.content()
 
-            soup = BeautifulSoup(rendered_html, "html.parser")
             logger.success(f"Successfully extracted content from {url}")
+            # Callers parsing in a worker process take the markup as is
+            if raw_html:
+                return rendered_html
 
-            return soup
+            return BeautifulSoup(rendered_html, "html.parser")
 
         except SkipScrape:
             # Don't retry for SkipScrape exceptions (404, etc.)
             raise
+        except ScrapingError as e:
+            logger.error(f"[{e.kind}] {e}")
+            raise
         except asyncio.TimeoutError as e:
             logger.error(
                 f"Timeout waiting for selector '{selector}' on {url}: {e}")
             raise ScrapingError(
-                f"Timeout waiting for selector '{selector}' on {url}: {e}")
+                f"Timeout waiting for selector '{selector}' on {url}: {e}", kind="timeout")
         except Exception as e:
             logger.error(f"Error scraping {url}: {str(e)}")
-            raise ScrapingError(f"Error scraping {url}: {str(e)}")
-
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except Exception as e:
-                    logger.error(f"Error closing page: {e}")
+            # The pool replaces a crashed page, context or browser on the retry
+            kind = "crashed" if _is_crash_error(e) else "unknown"
+            raise ScrapingError(f"Error scraping {url}: {str(e)}", kind=kind)
 
     async def extract_scrape_content(
         self,
@@ -237,47 +1879,64 @@ class WebScraper:
         wait_until: str = "domcontentloaded",
         simulate_behavior: bool = True,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Optional[BeautifulSoup]:
+        resource_blocker: Optional[ResourceBlocker] = None,
+        extraction_script: Optional[str] = None,
+        capture_scope: str = "document",
+        behavior_policy: Optional[BehaviorPolicy] = None,
+        wait_stats: Optional[WaitStats] = None,
+        raw_html: bool = False,
+    ) -> Optional[Union[BeautifulSoup, Dict[str, Any], str]]:
         try:
             return await retry_extract_scrape_content(
-                self, url, selector, timeout, wait_until, simulate_behavior, headers
+                self, url, selector, timeout=timeout, wait_until=wait_until,
+                simulate_behavior=simulate_behavior, headers=headers,
+                resource_blocker=resource_blocker, extraction_script=extraction_script,
+                capture_scope=capture_scope, behavior_policy=behavior_policy,
+                wait_stats=wait_stats, raw_html=raw_html,
             )
         except SkipScrape as e:
             logger.warning(f"Skipping scrape: {e}")
             return None
+        except ScrapingError as e:
+            logger.error(f"Giving up on {url} after {e.kind} error: {e}")
+            return None
         except Exception as e:
-            logger.error(f"Failed to scrape after {MAX_RETRIES} attempts: {e}")
+            logger.error(f"Failed to scrape {url}: {e}")
             return None
 
     async def close(self) -> None:
         """Clean up browser resources"""
-        try:
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-        except Exception as e:
-            logger.error(f"Error closing browser: {e}")
-        finally:
-            self.browser = None
-            self.context = None
+        if self._owns_pool:
+            await self.pool.close()
 
 
 @retry(
-    wait=wait_exponential(
-        multiplier=1, min=MIN_WAIT_BETWEEN_REQ, max=MAX_WAIT_BETWEEN_REQ),
-    stop=stop_after_attempt(MAX_RETRIES),
+    wait=wait_retry_after(wait_exponential(
+        multiplier=1, min=MIN_WAIT_BETWEEN_REQ, max=MAX_WAIT_BETWEEN_REQ)),
+    stop=stop_after_attempt(MAX_RETRIES) | stop_by_error_kind(),
     retry=retry_if_exception_type(ScrapingError),
     before_sleep=before_sleep_log(logger, "WARNING"),
     reraise=True,
 )
-async def retry_extract_scrape_content(scraper, *args, **kwargs):
-    return await scraper._extract_scrape_content(*args, **kwargs)
+async def retry_extract_scrape_content(scraper, url, *args, **kwargs):
+    site = site_key(url)
+    await circuit_breaker.before_request(site)
+
+    try:
+        result = await scraper._extract_scrape_content(url, *args, **kwargs)
+    except ScrapingError as e:
+        if isinstance(e, BlockedError):
+            block_stats.record(site, e.reason)
+        circuit_breaker.record_failure(site, e.kind)
+        raise
+
+    circuit_breaker.record_success(site)
+    return result
 
 
 class AsyncWebScraper:
-    def __init__(self):
-        self.scraper = WebScraper()
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        self.scraper = WebScraper(pool)
 
     async def __aenter__(self):
         return self.scraper
@@ -286,27 +1945,132 @@ class AsyncWebScraper:
         await self.scraper.close()
 
 
-async def scrape_url(url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5) -> Optional[BeautifulSoup]:
-    async with AsyncWebScraper() as scraper:
-        result = await scraper.extract_scrape_content(url, selector, headers=headers, wait_until=wait_until)
-        delay = random.uniform(min_sec, max_sec)
-        if delay >= 60:
-            minutes = int(delay // 60)
-            seconds = delay % 60
-            logger.info(f"Sleep for {minutes} min {seconds:.2f} sec")
-        else:
-            logger.info(f"Sleep for {delay:.2f} sec")
-
-        await asyncio.sleep(delay)
+async def scrape_url(url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5, resource_blocker=None, extraction_script=None, capture_scope="document", behavior_policy=None, wait_stats=None, pool=None, raw_html=False) -> Optional[Union[BeautifulSoup, Dict[str, Any], str]]:
+    async with AsyncWebScraper(pool or get_browser_pool()) as scraper:
+        result = await scraper.extract_scrape_content(url, selector, headers=headers, wait_until=wait_until, resource_blocker=resource_blocker, extraction_script=extraction_script, capture_scope=capture_scope, behavior_policy=behavior_policy, wait_stats=wait_stats, raw_html=raw_html)
+        await polite_sleep(min_sec, max_sec)
         return result
 
 
-async def scrape_urls(urls_and_selectors) -> list:
-    async with AsyncWebScraper() as scraper:
-        results = []
-        for url, selector in urls_and_selectors:
-            result = await scraper.extract_scrape_content(url, selector)
-            results.append(result)
+async def polite_sleep(min_sec=2, max_sec=5) -> None:
+    """Sleep a random politeness delay between two requests to the same shop"""
+    if max_sec <= 0:
+        return
+
+    delay = random.uniform(min_sec, max_sec)
+    if delay >= 60:
+        minutes = int(delay // 60)
+        seconds = delay % 60
+        logger.info(f"Sleep for {minutes} min {seconds:.2f} sec")
+    else:
+        logger.info(f"Sleep for {delay:.2f} sec")
+
+    await asyncio.sleep(delay)
+
+
+async def fetch_soup_http(url, selector, headers=None, capture_scope="document", raw_html=False) -> Optional[Union[BeautifulSoup, str]]:
+    """Fetch a page with plain HTTP and return it only if ``selector`` is already in the markup
+
+    With ``raw_html`` the markup is returned unparsed once a scoped parse has
+    found ``selector`` in it.
+    """
+    http_headers = random_profile().headers(headers)
+    # requests cannot decode brotli/zstd without extra packages
+    http_headers["Accept-Encoding"] = "gzip, deflate"
+
+    try:
+        response = await http_get(url, headers=http_headers)
+    except requests.RequestException as e:
+        logger.info(f"HTTP fetch failed for {url}: {e}")
+        return None
+
+    if response.status_code >= 400:
+        logger.info(f"HTTP {response.status_code} for {url}")
+        return None
+
+    if capture_scope == "selector" or raw_html:
+        soup = parse_scoped_html(response.text, selector)
+    else:
+        soup = BeautifulSoup(response.text, "html.parser")
+
+    if soup.select_one(selector) is None:
+        return None
+
+    logger.success(f"Successfully extracted content from {url} over HTTP")
+    return response.text if raw_html else soup
+
+
+async def _iterate(items) -> AsyncIterator:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def scrape_urls(items, concurrency: int = 2, min_sec: float = 2, max_sec: float = 5) -> AsyncIterator[tuple]:
+    """Scrape ``items`` on the shared pool and yield ``(url, result, timings)`` as pages complete.
+
+    ``items`` is a sync or async iterable of ``(url, selector)`` or
+    ``(url, selector, options)`` tuples, where ``options`` are keyword
+    arguments for ``extract_scrape_content``. ``result`` is the scraped
+    content or the exception that ended the scrape, so one bad URL never
+    stops the stream. At most ``concurrency`` pages are in flight and no
+    more than that many finished results are held before the caller
+    consumes them.
+    """
+    pool = get_browser_pool()
+    pool.ensure_capacity(concurrency)
+    scraper = WebScraper(pool)
+
+    async def scrape_one(url, selector, options, delay):
+        started = time.monotonic()
+        if delay:
+            await polite_sleep(min_sec, max_sec)
+        scrape_started = time.monotonic()
+
+        try:
+            result = await retry_extract_scrape_content(scraper, url, selector, **options)
+        except Exception as e:
+            logger.error(f"Failed to scrape {url}: {e}")
+            result = e
+
+        finished = time.monotonic()
+        timings = {
+            "delay": scrape_started - started,
+            "scrape": finished - scrape_started,
+        }
+        return url, result, timings
+
+    source = _iterate(items)
+    in_flight = set()
+    submitted = 0
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    url, selector, *rest = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+
+                options = rest[0] if rest else {}
+                # The first page of each slot starts straight away
+                in_flight.add(asyncio.create_task(
+                    scrape_one(url, selector, options, delay=submitted >= concurrency)))
+                submitted += 1
+
+            if not in_flight:
+                break
 
-            await asyncio.sleep(random.uniform(2, 5))
-        return results
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        await source.aclose()
@@ -0,0 +1,103 @@
+import time
+import threading
+import pandas as pd
+
+from typing import List, Tuple, Optional
+from loguru import logger
+from .connection import Connection
+
+STAGING_FLUSH_ROWS = 500
+STAGING_FLUSH_SECONDS = 30
+
+
+class StagingWriter:
+    """Buffers product rows for a staging table and writes them with multi-row INSERTs.
+
+    Rows are flushed once ``max_rows`` are buffered, when ``flush_due()`` finds
+    the oldest buffered row older than ``max_seconds`` and on shutdown. The
+    scrape statuses of the buffered URLs are applied in bulk in the same
+    transaction as their rows, so a URL never reads DONE without its rows.
+    """
+
+    def __init__(self, connection: Connection, table_name: str, status_table: str = "urls",
+                 max_rows: int = STAGING_FLUSH_ROWS, max_seconds: float = STAGING_FLUSH_SECONDS):
+        self.connection = connection
+        self.table_name = table_name
+        self.status_table = status_table
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self._frames: List[pd.DataFrame] = []
+        self._statuses: List[Tuple[int, str, str]] = []
+        self._rows = 0
+        self._oldest: Optional[float] = None
+        # Held while writing, so flushes from worker threads go out one at a time and in order
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.rows_written = 0
+        self.urls_written = 0
+        self.flushes = 0
+        self.write_time = 0.0
+
+    def add(self, pkey: int, status: str, timestamp: str, data: Optional[pd.DataFrame] = None) -> None:
+        with self._lock:
+            if data is not None and not data.empty:
+                self._frames.append(data)
+                self._rows += data.shape[0]
+            self._statuses.append((pkey, status, timestamp))
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if self._rows >= self.max_rows:
+                self._flush()
+
+    def flush_due(self) -> bool:
+        oldest = self._oldest
+        return oldest is not None and time.monotonic() - oldest >= self.max_seconds
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._statuses:
+            return
+
+        started = time.monotonic()
+        try:
+            # Rows and statuses commit together: after a crash a URL is either DONE with its rows or still pending
+            with self.connection.engine.begin() as conn:
+                if self._frames:
+                    data = pd.concat(self._frames, ignore_index=True)
+                    data.to_sql(self.table_name, conn, if_exists="append",
+                                index=False, method="multi", chunksize=self.max_rows)
+
+                self.connection.update_url_scrape_statuses(
+                    self._statuses, self.status_table, conn)
+
+        except Exception as e:
+            # Nothing was committed and the buffer is kept, so the shutdown flush tries these rows again
+            logger.error(f"Error flushing {self._rows} row(s) to {self.table_name}: {e}")
+            raise
+
+        self.write_time += time.monotonic() - started
+        self.flushes += 1
+        self.rows_written += self._rows
+        self.urls_written += len(self._statuses)
+        logger.success(
+            f"Successfully loaded {self._rows} records for {len(self._statuses)} URL(s) to the {self.table_name}.")
+
+        self._frames = []
+        self._statuses = []
+        self._rows = 0
+        self._oldest = None
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        summary = (
+            f"Staging writes: {self.rows_written} row(s) for {self.urls_written} URL(s) "
+            f"in {self.flushes} flush(es)"
+        )
+        if self.write_time:
+            summary += f", {self.rows_written / self.write_time:.0f} rows/s while writing"
+        if elapsed:
+            summary += f", {self.rows_written / elapsed:.2f} rows/s over the run"
+        return summary
@@ -1,15 +1,40 @@
 import os
 import sys
+import time
+import signal
+import asyncio
 import argparse
+import multiprocessing
 import datetime as dt
 
+from multiprocessing.connection import Connection as PipeConnection
+from typing import List, Dict, Any, Optional
 from loguru import logger
 from functions.connection import Connection
 
 from functions.factory import SHOPS, run_etl
+from functions.etl import PetProductsETL
+from functions.scraper import close_browser_pool, block_stats, site_key
+from functions.http_client import close_http_session
+from functions.pipeline import close_transform_pool
 
 shop_choice = [i for i in SHOPS.keys()]
 PROGRAM_NAME = "Pet Products Scraper"
+# Shops are separate sites, so their politeness delays can overlap
+DEFAULT_PARALLEL_SHOPS = 4
+
+
+def parse_shops(value: str) -> List[str]:
+    if value == "all":
+        return shop_choice
+
+    shops = [shop.strip() for shop in value.split(",") if shop.strip()]
+    unknown = [shop for shop in shops if shop not in SHOPS]
+    if unknown or not shops:
+        raise argparse.ArgumentTypeError(
+            f"invalid shop(s): {', '.join(unknown) or value!r} (choose 'all' or from {', '.join(shop_choice)})")
+    return shops
+
 
 parser = argparse.ArgumentParser(
     prog=PROGRAM_NAME,
@@ -18,31 +43,176 @@ parser = argparse.ArgumentParser(
 
 parser.add_argument("task", choices=[
                     "get_links", "scrape"], help="Identify the task to be executed. get_links=get links from registered shops; scrape=scrape products.")
-parser.add_argument("-s", "--shop", choices=shop_choice,
-                    help="Select a shop to scrape. Default: all shops.")
-args = parser.parse_args()
+parser.add_argument("-s", "--shop", type=parse_shops, default=shop_choice,
+                    help="Select a shop, a comma-separated list of shops or 'all'. Default: all shops.")
+parser.add_argument("-p", "--parallel", type=int, default=DEFAULT_PARALLEL_SHOPS,
+                    help=f"Number of shops run at the same time. Default: {DEFAULT_PARALLEL_SHOPS}.")
 
-if __name__ == "__main__":
-    start_time = dt.datetime.now()
+
+async def run_shop(task: str, shop: str) -> Dict[str, Any]:
+    """Run one task for one shop; a failure is reported instead of stopping the other shops"""
+    started = time.monotonic()
+    result = {"shop": shop, "status": "ok", "detail": ""}
+
+    try:
+        client = run_etl(shop)
+
+        if task == "get_links":
+            await client.get_links_by_category_async()
+
+        elif task == "scrape":
+            await client.get_product_infos_async()
+            counts = ", ".join(
+                f"{status}={n}" for status, n in sorted(client.scrape_counts.items()))
+            blocked = block_stats.count(site_key(client.BASE_URL))
+            result["detail"] = f"{counts or 'no URLs'}, blocked={blocked}"
+
+    except Exception as e:
+        logger.error(f"[{shop}] {task} failed: {e}")
+        result["status"] = "failed"
+        result["detail"] = str(e)
+
+    result["elapsed"] = dt.timedelta(seconds=round(time.monotonic() - started))
+    return result
+
+
+def needs_own_process(task: str, shop: str) -> bool:
+    """Whether the shop still runs ``task`` through a sync hook and the nest_asyncio shim.
+
+    Those hooks block the loop (time.sleep, requests) and their nested
+    asyncio.run calls stack, so on a shared loop they would stall every
+    other shop; they get a process and an event loop of their own instead.
+    """
+    hook = "extract_async" if task == "get_links" else "transform_async"
+    return getattr(SHOPS[shop], hook) is getattr(PetProductsETL, hook)
+
+
+def configure_logging(shop: str = "") -> None:
+    # loguru's file rotation is not safe across processes, so each worker process writes files of its own
+    prefix = f"{shop.lower()}_" if shop else ""
     logger.remove()
-    logger.add("logs/std_out.log", rotation="10 MB", level="INFO")
-    logger.add("logs/std_err.log", rotation="10 MB", level="ERROR")
+    logger.add(f"logs/{prefix}std_out.log", rotation="10 MB", level="INFO")
+    logger.add(f"logs/{prefix}std_err.log", rotation="10 MB", level="ERROR")
     logger.add(sys.stdout, level="INFO")
     logger.add(sys.stderr, level="ERROR")
 
-    logger.info(f"{PROGRAM_NAME} has started")
 
-    task = args.task
-    shop = args.shop
+def run_shop_in_process(task: str, shop: str, results: PipeConnection) -> None:
+    """Worker process entry point: one shop on its own event loop, browser pool and HTTP session"""
+    configure_logging(shop)
+    results.send(asyncio.run(run_isolated(task, shop)))
+
+
+async def run_isolated(task: str, shop: str) -> Dict[str, Any]:
+    # The parent terminates the process on SIGTERM or Ctrl-C; cancelling lets the shop flush its buffered rows
+    asyncio.get_running_loop().add_signal_handler(
+        signal.SIGTERM, asyncio.current_task().cancel)
+    try:
+        return await run_shop(task, shop)
+    finally:
+        await close_browser_pool()
+        close_http_session()
+        close_transform_pool()
 
-    client = run_etl(shop)
 
-    if task == "get_links":
-        client.get_links_by_category()
+def wait_for_result(process: multiprocessing.Process, results: PipeConnection) -> Optional[Dict[str, Any]]:
+    """Block until the worker process sends its result and exits; None if it died first"""
+    try:
+        return results.recv()
+    except EOFError:
+        return None
+    finally:
+        process.join()
 
-    elif task == "scrape":
-        client.get_product_infos()
+
+async def run_in_process(task: str, shop: str) -> Dict[str, Any]:
+    """Run one shop in a fresh process, so a crash or OOM kill only fails that shop and no module state carries over"""
+    started = time.monotonic()
+    # Spawned rather than forked: a fork would copy the Playwright driver's threads mid-flight
+    context = multiprocessing.get_context("spawn")
+    results, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=run_shop_in_process, args=(task, shop, sender), name=f"{shop}-{task}")
+    process.start()
+    sender.close()
+
+    try:
+        result = await asyncio.to_thread(wait_for_result, process, results)
+    except asyncio.CancelledError:
+        # The worker only hears SIGTERM from us; it flushes its rows before exiting
+        if process.is_alive():
+            process.terminate()
+        raise
+    finally:
+        results.close()
+
+    if result is None:
+        logger.error(f"[{shop}] {task} worker process exited with code {process.exitcode}")
+        result = {"shop": shop, "status": "failed",
+                  "detail": f"worker process exited with code {process.exitcode}",
+                  "elapsed": dt.timedelta(seconds=round(time.monotonic() - started))}
+    return result
+
+
+async def run(task: str, shops: List[str], parallel: int) -> List[Dict[str, Any]]:
+    """Run the task for every shop, at most ``parallel`` shops at once.
+
+    Shops with async hooks share this event loop and its capped browser pool,
+    HTTP session and database engine; shops still on sync hooks each run in a
+    process of their own, where those caps apply per process.
+    """
+    parallel = max(1, parallel)
+    semaphore = asyncio.Semaphore(parallel)
+    loop = asyncio.get_running_loop()
+    # SIGTERM cancels the run like Ctrl-C does, so every shop flushes its buffered rows on the way out
+    loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
+    async def run_limited(shop):
+        async with semaphore:
+            if needs_own_process(task, shop):
+                return await run_in_process(task, shop)
+            return await run_shop(task, shop)
+
+    try:
+        return await asyncio.gather(*(run_limited(shop) for shop in shops))
+
+    finally:
+        await close_browser_pool()
+        close_http_session()
+        close_transform_pool()
+
+
+def log_summary(task: str, results: List[Dict[str, Any]]) -> None:
+    failed = sum(result["status"] != "ok" for result in results)
+    logger.info(
+        f"Summary of {task}: {len(results) - failed} shop(s) ok, {failed} failed")
+    for result in results:
+        logger.info(
+            f"  {result['shop']:<20} {result['status']:<7} {result['elapsed']}  {result['detail']}")
+
+
+if __name__ == "__main__":
+    # Parsed here so transform worker processes can import this module
+    args = parser.parse_args()
+    start_time = dt.datetime.now()
+    configure_logging()
+
+    logger.info(f"{PROGRAM_NAME} has started")
+
+    task = args.task
+    shops = args.shop
+
+    try:
+        results = asyncio.run(run(task, shops, args.parallel))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.warning(f"{PROGRAM_NAME} was interrupted after {dt.datetime.now() - start_time}")
+        sys.exit(130)
+    log_summary(task, results)
 
     end_time = dt.datetime.now()
     duration = end_time - start_time
-    logger.info(f"{PROGRAM_NAME} (shop={shop}) has ended. Elapsed: {duration}")
+    logger.info(
+        f"{PROGRAM_NAME} (shop={','.join(shops)}) has ended. Elapsed: {duration}")
+
+    if any(result["status"] != "ok" for result in results):
+        sys.exit(1)
@@ -1,6 +1,5 @@
 import re
 import pandas as pd
-import asyncio
 
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
@@ -16,19 +15,18 @@ class AsdaETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
 
-    def extract(self, category):
+    async def extract_async(self, category):
         category_link = f"{self.BASE_URL}{category}"
         urls = []
 
-        soup = asyncio.run(self.scrape(category_link, '.layout__main'))
+        soup = await self.scrape(category_link, '.layout__main')
 
         if soup.find('div', class_="co-pagination"):
             n_pages = int(
                 soup.find('div', class_="co-pagination__max-page").text)
 
             for p in range(1, n_pages):
-                soup_page_pagination = asyncio.run(
-                    self.scrape(f"{category_link}?page={p}", '#main-content'))
+                soup_page_pagination = await self.scrape(f"{category_link}?page={p}", '#main-content')
                 for product_container in soup_page_pagination.find_all('ul', class_="co-product-list__main-cntr"):
                     for product_list in product_container.find_all('li'):
                         if product_list.find('a'):
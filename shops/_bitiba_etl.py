@@ -7,6 +7,7 @@ import pandas as pd
 import requests
 
 from functions.etl import PetProductsETL
+from functions.scraper import BehaviorPolicy
 from bs4 import BeautifulSoup
 from loguru import logger
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type, before_sleep_log
@@ -27,6 +28,8 @@ class BitibaETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'main#page-content'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 310
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 350
+        # Simulation is cheap next to this shop's politeness delay
+        self.BEHAVIOR_POLICY = BehaviorPolicy("always")
 
     @retry(
         wait=wait_exponential(
@@ -1,4 +1,3 @@
-import asyncio
 import requests
 import pandas as pd
 from functions.etl import PetProductsETL
@@ -15,7 +14,7 @@ class BurnsPetETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
 
-    def extract(self, category):
+    async def extract_async(self, category):
         category_link = f"{self.BASE_URL}{category}"
 
         urls = []
@@ -28,8 +27,8 @@ class BurnsPetETL(PetProductsETL):
                 category_link_page = f"{category_link}/?paged={page}"
 
             # Parse request response
-            soup = asyncio.run(self.scrape(
-                category_link_page, '.productlist-products'))
+            soup = await self.scrape(
+                category_link_page, '.productlist-products')
             if soup:
                 links = soup.select(
                     "a[class*='home-productrange-slider-item __productlist']")
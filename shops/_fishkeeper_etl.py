@@ -1,12 +1,9 @@
 import asyncio
-import random
 import json
 import requests
 import pandas as pd
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
 from loguru import logger
 
 
@@ -18,33 +15,20 @@ class FishKeeperETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#maincontent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.EXTRACTION_SCRIPT = """
+            () => {
+                const ldJson = document.querySelector("script[type*='application/ld+json']");
+                return ldJson ? { ld_json: JSON.parse(ldJson.textContent) } : null;
+            }
+        """
 
     async def product_list_scroll(self, url, selector):
-        soup = None
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"]
-                }
-
-                browser = await p.chromium.launch(**browser_args)
-                context = await browser.new_context(
-                    user_agent=UserAgent().random,
-                    viewport={"width": random.randint(
-                        1200, 1600), "height": random.randint(800, 1200)},
-                    locale="en-US"
-                )
-
-                page = await context.new_page()
-                await page.set_extra_http_headers({
-                    "User-Agent": UserAgent().random,
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Origin": "https://www.fishkeeper.co.uk",
-                    "Referer": url,
-                })
-
+            headers = {
+                "Origin": "https://www.fishkeeper.co.uk",
+                "Referer": url,
+            }
+            async with self.browser_page(url, headers=headers) as page:
                 await page.goto(url, wait_until="domcontentloaded")
                 await page.wait_for_selector(selector, timeout=30000)
 
@@ -66,19 +50,13 @@ class FishKeeperETL(PetProductsETL):
                 logger.info(
                     f"Successfully extracted data from {url}"
                 )
-                sleep_time = random.uniform(
-                    2, 5)
-                logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
-                return soup.find('ol', class_="ais-InfiniteHits-list")
+
+            soup = BeautifulSoup(rendered_html, "html.parser")
+            return soup.find('ol', class_="ais-InfiniteHits-list")
 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
-        finally:
-            if browser:
-                await browser.close()
-
     def extract(self, category):
         url = self.BASE_URL + category
 
@@ -93,8 +71,11 @@ class FishKeeperETL(PetProductsETL):
 
     def transform(self,  soup: BeautifulSoup, url: str):
         try:
-            data = json.loads(soup.select_one(
-                "script[type*='application/ld+json']").text)
+            if isinstance(soup, dict):
+                data = soup["ld_json"]
+            else:
+                data = json.loads(soup.select_one(
+                    "script[type*='application/ld+json']").text)
             product_title = data["name"]
 
             rating = 0
@@ -1,8 +1,8 @@
 import pandas as pd
-import asyncio
 import math
 import re
 from functions.etl import PetProductsETL
+from functions.scraper import DEFAULT_BLOCKED_DOMAINS
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -15,20 +15,24 @@ class HarringtonsETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#MainContent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        # Ratings are read from the review widget rendered in the page
+        self.BLOCKED_DOMAINS = DEFAULT_BLOCKED_DOMAINS
+        # The container is in the server HTML but the widget is not, so always render
+        self.HTTP_FIRST = False
 
-    def extract(self, category):
+    async def extract_async(self, category):
         category_link = f"{self.BASE_URL}{category}"
 
         urls = []
-        soup = asyncio.run(self.scrape(category_link, '#MainContent'))
+        soup = await self.scrape(category_link, '#MainContent')
 
         n_product = int(soup.find(
             'span', class_="boost-pfs-filter-total-product").find(string=True, recursive=False))
         pagination_length = math.ceil(n_product / 24)
 
         for i in range(1, pagination_length + 1):
-            soup_pagination = asyncio.run(self.scrape(
-                f"{category_link}?page={i}", '#MainContent'))
+            soup_pagination = await self.scrape(
+                f"{category_link}?page={i}", '#MainContent')
             for prod_list in soup_pagination.find_all('li', class_="list-product-card__item"):
                 urls.append(self.BASE_URL + prod_list.find('a',
                             class_="card-product__heading-link").get('href').replace('#', ''))
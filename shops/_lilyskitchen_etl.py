@@ -1,4 +1,3 @@
-import asyncio
 import json
 import pandas as pd
 from functions.etl import PetProductsETL
@@ -14,9 +13,9 @@ class LilysKitchenETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
 
-    def extract(self, category):
+    async def extract_async(self, category):
         category_link = f"{self.BASE_URL}{category}"
-        soup = asyncio.run(self.scrape(category_link, 'main.js-main'))
+        soup = await self.scrape(category_link, 'main.js-main')
         if soup:
             script_data = None
 
@@ -5,6 +5,7 @@ import pandas as pd
 
 
 from functions.etl import PetProductsETL
+from functions.scraper import DEFAULT_BLOCKED_DOMAINS
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -17,6 +18,10 @@ class NaturesMenuETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#maincontent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        # Ratings are read from the review widget rendered in the page
+        self.BLOCKED_DOMAINS = DEFAULT_BLOCKED_DOMAINS
+        # The container is in the server HTML but the widget is not, so always render
+        self.HTTP_FIRST = False
 
     import re
 
@@ -1,12 +1,8 @@
 import asyncio
-import random
-import time
 import pandas as pd
 
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
 from loguru import logger
 
 
@@ -20,31 +16,12 @@ class OcadoETL(PetProductsETL):
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
 
     async def product_list_scrolling(self, url, selector):
-        soup = None
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"]
-                }
-
-                browser = await p.chromium.launch(**browser_args)
-                context = await browser.new_context(
-                    user_agent=UserAgent().random,
-                    viewport={"width": random.randint(
-                        1200, 1600), "height": random.randint(800, 1200)},
-                    locale="en-US"
-                )
-
-                page = await context.new_page()
-                await page.set_extra_http_headers({
-                    "User-Agent": UserAgent().random,
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Origin": "https://www.ocado.com",
-                    "Referer": url,
-                })
-
+            headers = {
+                "Origin": "https://www.ocado.com",
+                "Referer": url,
+            }
+            async with self.browser_page(url, headers=headers) as page:
                 await page.goto(url, wait_until="domcontentloaded")
                 await page.wait_for_selector(selector, timeout=30000)
 
@@ -61,7 +38,7 @@ class OcadoETL(PetProductsETL):
                     # Scroll to the current position
                     await page.evaluate(f'window.scrollTo(0, {current_position})')
                     current_position += scroll_step
-                    time.sleep(scroll_delay)
+                    await asyncio.sleep(scroll_delay)
 
                 logger.info("Scraping complete. Extracting content...")
 
@@ -69,19 +46,13 @@ class OcadoETL(PetProductsETL):
                 logger.info(
                     f"Successfully extracted data from {url}"
                 )
-                sleep_time = random.uniform(
-                    3, 5)
-                logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
-                return soup.find('ul', class_="fops-regular")
+
+            soup = BeautifulSoup(rendered_html, "html.parser")
+            return soup.find('ul', class_="fops-regular")
 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
-        finally:
-            if browser:
-                await browser.close()
-
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
         soup = asyncio.run(self.scrape(
@@ -1,13 +1,10 @@
 import re
 import math
-import random
 import asyncio
 import pandas as pd
 
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
 from loguru import logger
 
 import warnings
@@ -24,31 +21,12 @@ class PetPlanetETL(PetProductsETL):
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
 
     async def product_list_scrolling(self, url, selector, click_times):
-        soup = None
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"]
-                }
-
-                browser = await p.chromium.launch(**browser_args)
-                context = await browser.new_context(
-                    user_agent=UserAgent().random,
-                    viewport={"width": random.randint(
-                        1200, 1600), "height": random.randint(800, 1200)},
-                    locale="en-US"
-                )
-
-                page = await context.new_page()
-                await page.set_extra_http_headers({
-                    "User-Agent": UserAgent().random,
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Origin": "https://www.petplanet.co.uk",
-                    "Referer": url,
-                })
-
+            headers = {
+                "Origin": "https://www.petplanet.co.uk",
+                "Referer": url,
+            }
+            async with self.browser_page(url, headers=headers) as page:
                 await page.goto(url, wait_until="load")
                 await page.wait_for_selector(selector, timeout=30000)
 
@@ -85,19 +63,13 @@ class PetPlanetETL(PetProductsETL):
                 logger.info(
                     f"Successfully extracted data from {url}"
                 )
-                sleep_time = random.uniform(
-                    3, 5)
-                logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
-                return soup.find_all('a', class_="product-name")
+
+            soup = BeautifulSoup(rendered_html, "html.parser")
+            return soup.find_all('a', class_="product-name")
 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
-        finally:
-            if browser:
-                await browser.close()
-
     def extract(self, category):
         url = f"{self.BASE_URL}{category}"
         urls = []
@@ -1,13 +1,63 @@
 import json
 import math
-import asyncio
 import pandas as pd
 
+from typing import Dict, Any, List, Optional
 from functions.etl import PetProductsETL
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
 
 
+def product_records(product_data_dict: Dict[str, Any], url: str) -> List[Dict[str, Any]]:
+    """Build one row per variant from the product page's __NEXT_DATA__ payload"""
+    # Get base details
+    base_product = product_data_dict["props"]["pageProps"]["baseProduct"]
+    product_title = base_product["name"]
+    rating = product_data_dict["props"]["pageProps"]["productRating"]
+    if rating:
+        rating = "{} out of 5".format(rating["averageRating"])
+    else:
+        rating = None
+    description = base_product["description"]
+    product_url = url.replace("https://www.petsathome.com", "")
+
+    # Iterate through all product variants
+    records = []
+    for variant in base_product["products"]:
+        price = variant["price"]["base"]
+        discounted_price = variant["price"]["promotionBase"]
+
+        if discounted_price:
+            discount_percentage = (price - discounted_price) / price
+        else:
+            discount_percentage = None
+
+        records.append({
+            "name": product_title,
+            "rating": rating,
+            "description": description,
+            "url": product_url,
+            "variant": variant["label"],
+            "price": price,
+            "discounted_price": discounted_price,
+            "discount_percentage": discount_percentage,
+            "image_urls": ', '.join(variant['imageUrls'])
+        })
+
+    return records
+
+
+def transform_product_page(html: str, url: str) -> Optional[List[Dict[str, Any]]]:
+    """Worker-process transform entry point: parses only the __NEXT_DATA__ script of the page"""
+    try:
+        soup = BeautifulSoup(html, "html.parser",
+                             parse_only=SoupStrainer("script", id="__NEXT_DATA__"))
+        return product_records(json.loads(soup.select_one("[id='__NEXT_DATA__']").text), url)
+
+    except Exception as e:
+        logger.error(f"Error scraping {url}: {e}")
+
+
 class PetsAtHomeETL(PetProductsETL):
     def __init__(self):
         super().__init__()
@@ -16,13 +66,15 @@ class PetsAtHomeETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = ''
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        # The __NEXT_DATA__ payload is large, so parse it away from the event loop
+        self.TRANSFORM_PROCESS = transform_product_page
 
-    def extract(self, category):
+    async def extract_async(self, category):
         urls = []
         url = self.BASE_URL + f"/product/listing/{category}"
 
-        soup = asyncio.run(self.scrape(
-            url, '.search-results_grid__rmdgH', wait_until='load'))
+        soup = await self.scrape(
+            url, '.search-results_grid__rmdgH', wait_until='load')
 
         if not soup:
             logger.error(f"[ERROR] Initial scrape failed for URL: {url}")
@@ -44,8 +96,8 @@ class PetsAtHomeETL(PetProductsETL):
 
         for n in range(1, n_pagination + 1):
             pagination_url = url + f'?page={n}'
-            page_soup = asyncio.run(self.scrape(
-                pagination_url, '.search-results_grid__rmdgH', wait_until='load'))
+            page_soup = await self.scrape(
+                pagination_url, '.search-results_grid__rmdgH', wait_until='load')
 
             if not page_soup:
                 logger.warning(
@@ -72,60 +124,10 @@ class PetsAtHomeETL(PetProductsETL):
 
     def transform(self, soup: BeautifulSoup, url: str):
         try:
-            # Get the data from encoded JSON
             product_data = soup.select_one("[id='__NEXT_DATA__']")
-            product_data_dict = json.loads(product_data.text)
-
-            # Get base details
-            product_title = product_data_dict["props"]["pageProps"]["baseProduct"]["name"]
-            rating = product_data_dict["props"]["pageProps"]["productRating"]
-            rating = product_data_dict["props"]["pageProps"]["productRating"]
-            if rating:
-                rating = "{} out of 5".format(rating["averageRating"])
-            else:
-                rating = None
-            description = product_data_dict["props"]["pageProps"]["baseProduct"]["description"]
-            product_url = url.replace("https://www.petsathome.com", "")
-
-            # Placeholder for variant details
-            variants = []
-            prices = []
-            discounted_prices = []
-            discount_percentages = []
-            image_urls = []
-
-            # Iterate through all product variants
-            for variant in product_data_dict["props"]["pageProps"]["baseProduct"]["products"]:
-                variants.append(variant["label"])
-
-                price = variant["price"]["base"]
-                discounted_price = variant["price"]["promotionBase"]
-
-                prices.append(price)
-                discounted_prices.append(discounted_price)
-
-                if discounted_price:
-                    discount_percentage = (price - discounted_price) / price
-                else:
-                    discount_percentage = None
-
-                discount_percentages.append(discount_percentage)
-                image_urls.append(', '.join(variant['imageUrls']))
-
-            # Compile the data acquired into dataframe
-            df = pd.DataFrame(
-                {
-                    "variant": variants,
-                    "price": prices,
-                    "discounted_price": discounted_prices,
-                    "discount_percentage": discount_percentages,
-                    "image_urls": image_urls
-                }
-            )
-            df.insert(0, "url", product_url)
-            df.insert(0, "description", description)
-            df.insert(0, "rating", rating)
-            df.insert(0, "name", product_title)
+            records = product_records(json.loads(product_data.text), url)
+
+            df = pd.DataFrame.from_records(records)
             df.insert(0, "shop", self.SHOP)
 
             return df
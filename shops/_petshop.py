@@ -1,6 +1,4 @@
 import math
-import asyncio
-import requests
 import pandas as pd
 
 
@@ -18,11 +16,11 @@ class PetShopETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
 
-    def extract(self, category):
+    async def extract_async(self, category):
         category_link = f"{self.BASE_URL}{category}"
         urls = []
-        soup = asyncio.run(self.scrape(
-            category_link, 'div.facets-facet-browse-items'))
+        soup = await self.scrape(
+            category_link, 'div.facets-facet-browse-items')
 
         n_products = int(soup.select_one(
             "h1[class='facets-facet-browse-title']")["data-quantity"])
@@ -35,8 +33,8 @@ class PetShopETL(PetProductsETL):
             else:
                 category_link_page = f"{category_link}?page={p}"
 
-            pagination_soup = asyncio.run(self.scrape(
-                category_link_page, 'div.facets-facet-browse-items'))
+            pagination_soup = await self.scrape(
+                category_link_page, 'div.facets-facet-browse-items')
             if pagination_soup:
                 product_links_a = pagination_soup.select(
                     "a[class='facets-item-cell-grid-link-image']")
@@ -49,7 +47,7 @@ class PetShopETL(PetProductsETL):
 
         return df
 
-    def transform(self, soup: BeautifulSoup, url: str):
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find('h1', class_="product-details-full-content-header-title").find(
                 string=True, recursive=False).get_text(strip=True)
@@ -93,7 +91,7 @@ class PetShopETL(PetProductsETL):
             image_urls.append(', '.join([img.find('img').get(
                 'src') for img in soup.find('ul', class_="bxslider").find_all('li')]))
 
-            get_price_details = requests.get(
+            get_price_details = await self.browser_session.get(
                 f"https://www.petshop.co.uk/api/cacheable/items?c=3934951&country=GB&currency=GBP&fieldset=details&include=facets&language=en&n=2&pricelevel=5&url={product_url.replace('/', '')}&use_pcv=T")
             if get_price_details.status_code == 200:
                 product_info = get_price_details.json()['items'][0]
@@ -4,7 +4,7 @@ import requests
 import pandas as pd
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from functions.identity import random_profile
 from loguru import logger
 
 
@@ -55,7 +55,7 @@ class PetShopOnlineETL(PetProductsETL):
             image_urls = []
 
             headers = {
-                "User-Agent": UserAgent().random,
+                "User-Agent": random_profile().user_agent,
                 'Accept': 'application/json'
             }
 
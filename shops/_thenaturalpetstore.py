@@ -5,7 +5,7 @@ import pandas as pd
 
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from functions.identity import random_profile
 from loguru import logger
 
 
@@ -68,7 +68,7 @@ class TheNaturalPetStoreETL(PetProductsETL):
             image_urls = []
 
             headers = {
-                "User-Agent": UserAgent().random,
+                "User-Agent": random_profile().user_agent,
                 'Accept': 'application/json'
             }
 
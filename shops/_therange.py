@@ -1,13 +1,11 @@
 import asyncio
 import math
-import random
 import pandas as pd
 
 from functions.etl import PetProductsETL
+from functions.scraper import BehaviorPolicy
 from bs4 import BeautifulSoup
 from loguru import logger
-from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
 
 
 class TheRangeETL(PetProductsETL):
@@ -18,60 +16,20 @@ class TheRangeETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#variant_container'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 5
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 10
+        # Simulation is cheap next to this shop's politeness delay
+        self.BEHAVIOR_POLICY = BehaviorPolicy("always")
+        # transform() drives the shared browser, so it must stay on the event loop
+        self.TRANSFORM_WORKERS = 0
 
     async def get_data_variant(self, url):
-        browser = None
-        data = None
-
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=["--disable-blink-features=AutomationControlled"]
-                )
-
-                context = await browser.new_context(
-                    user_agent=UserAgent().random,
-                    viewport={"width": random.randint(
-                        1200, 1600), "height": random.randint(800, 1200)},
-                    locale="en-US"
-                )
-
-                page = await context.new_page()
-
-                # Capture first JSON response
-                async def handle_response(response):
-                    nonlocal data
-                    try:
-                        if "application/json" in response.headers.get("content-type", "") and response.status == 200:
-                            json_data = await response.json()
-                            logger.info(f"Captured JSON from: {response.url}")
-                            data = json_data
-                    except Exception as e:
-                        logger.error(f"Failed to parse JSON: {e}")
-
-                page.on("response", handle_response)
-
-                await page.set_extra_http_headers({
-                    "User-Agent": UserAgent().random,
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Origin": "https://www.therange.co.uk",
-                    "Referer": url,
-                })
-
-                await page.goto(url, wait_until="networkidle")
-
-                sleep_time = random.uniform(2, 5)
-                logger.info(f"Sleeping for {sleep_time:.2f} seconds...")
-                await asyncio.sleep(sleep_time)
-
-                return data
-
-        except Exception as e:
-            logger.error(f"An error occurred: {e}")
-        finally:
-            if browser:
-                await browser.close()
+        headers = {
+            "Origin": "https://www.therange.co.uk",
+            "Referer": url,
+        }
+        responses = await self.capture_json(
+            url, [r"/api/productlist"], headers=headers, min_sec=2, max_sec=5)
+
+        return responses[0]["data"] if responses else None
 
     def extract(self, category):
         category_link = f"https://www.therange.co.uk{category}"
@@ -1,6 +1,5 @@
 import asyncio
 import math
-import requests
 import pandas as pd
 from functions.etl import PetProductsETL
 from bs4 import BeautifulSoup
@@ -46,7 +45,7 @@ class VetShopETL(PetProductsETL):
 
         return df
 
-    def transform(self, soup: BeautifulSoup, url: str):
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find(
                 'h1', class_="item-details-content-header-title").find(string=True, recursive=False).get_text()
@@ -104,7 +103,7 @@ class VetShopETL(PetProductsETL):
                     price = float(soup.find_all(
                         'p', class_="item-views-blb-price-option-price")[1].get_text().replace('£', ''))
                 else:
-                    get_price_details = requests.get(
+                    get_price_details = await self.browser_session.get(
                         f"https://www.vetshop.co.uk/api/items?c=3934951&country=GB&currency=GBP&fields=pricelevel4%2Cpricelevel4_formatted&fieldset=details&include=facets&language=en&n=3&pricelevel=4&url={product_url.replace('/', '')}")
                     if get_price_details.status_code == 200:
                         product_info = get_price_details.json()['items'][0]
@@ -1,15 +1,11 @@
-import asyncio
-import requests
 import re
-import random
 import json
-import time
 import pandas as pd
 
 from functions.etl import PetProductsETL
+from functions.scraper import BehaviorPolicy, polite_sleep
 from bs4 import BeautifulSoup
 from loguru import logger
-from fake_useragent import UserAgent
 
 
 class ZooplusETL(PetProductsETL):
@@ -20,47 +16,35 @@ class ZooplusETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#page-content'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 301
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 305
+        # Simulation is cheap next to this shop's politeness delay
+        self.BEHAVIOR_POLICY = BehaviorPolicy("always")
+        self.CAPTURE_SCOPE = "selector"
 
-    def get_product_links(self, url, headers):
+    async def get_product_links(self, url, headers):
         try:
-            # Parse request response
-            response = requests.get(url=url, headers=headers)
+            # The discover API answers plain HTTP once a browser has earned the cookies
+            response = await self.browser_session.get(url, headers=headers)
             response.raise_for_status()
 
             logger.info(
                 f"Successfully extracted data from {url} {response.status_code}"
             )
-            sleep_time = random.uniform(
+            await polite_sleep(
                 self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
-            time.sleep(sleep_time)
-            logger.info(f"Sleeping for {sleep_time} seconds...")
             return response
 
         except Exception as e:
             logger.error(f"Error in parsing {url}: {e}")
 
-    def extract(self, category):
+    async def extract_async(self, category):
+        # The browser session supplies the rest of the headers for its own identity
         headers = {
-            "Accept": 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br, zstd',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Cache-Control': 'max-age=0',
-            "User-Agent": UserAgent().random,
             'Referer': 'https://www.zooplus.co.uk',
-            'Priority': "u=0, i",
-            "Upgrade-Insecure-Requests": "1",
-            "Connection": "keep-alive",
-            "Sec-Ch-Ua": "\"Not(A:Brand\";v=\"99\", \"Opera GX\";v=\"118\", \"Chromium\";v=\"133\"",
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": "\"Windows\"",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
             "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1"
         }
         urls = []
         n_page_pagination = 1
-        list_prod_api = self.get_product_links(
+        list_prod_api = await self.get_product_links(
             f"https://www.zooplus.co.uk/api/discover/v1/products/list-faceted-partial?&path={category}&domain=zooplus.co.uk&language=en&page=1&size=24&ab=shop-10734_shop_product_catalog_api_enabled_targeted_delivery.enabled%2Bidpo-1141_article_based_product_cards_targeted_delivery.on%2Bidpo-1390_rebranding_foundation_targeted_delivery.on%2Bexplore-3092-price-redesign_targeted_delivery.on", headers=headers)
         if list_prod_api.status_code == 200:
             if list_prod_api.json()['pagination'] == None:
@@ -75,7 +59,7 @@ class ZooplusETL(PetProductsETL):
             for i in range(1, n_page_pagination + 1):
                 pagination_url = f"https://www.zooplus.co.uk/api/discover/v1/products/list-faceted-partial?&path={category}&domain=zooplus.co.uk&language=en&page={i}&size=24&ab=shop-10734_shop_product_catalog_api_enabled_targeted_delivery.enabled%2Bidpo-1141_article_based_product_cards_targeted_delivery.on%2Bidpo-1390_rebranding_foundation_targeted_delivery.on%2Bexplore-3092-price-redesign_targeted_delivery.on"
 
-                pagination_product_api = self.get_product_links(
+                pagination_product_api = await self.get_product_links(
                     pagination_url, headers=headers)
                 if pagination_product_api.status_code == 200:
                     for products in pagination_product_api.json()['productList']['products']:
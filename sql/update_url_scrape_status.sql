@@ -1,4 +1,4 @@
 UPDATE {table_name} 
-SET scrape_status='{status}'
-    ,updated_date='{timestamp}'
-WHERE id={pkey}
\ No newline at end of file
+SET scrape_status=:status
+    ,updated_date=:timestamp
+WHERE id IN :pkeys
\ No newline at end of file
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+
+import functions.scraper as scraper
+from functions.scraper import BrowserPool
+
+
+class FakePage:
+    def on(self, event, handler):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def on(self, event, handler):
+        pass
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.browser.contexts.remove(self)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.launched = []
+        self.firefox = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+def test_restart_browsers_under_load(monkeypatch):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(scraper, "async_playwright", lambda: playwright)
+    pool = BrowserPool(n_browsers=1, contexts_per_browser=2)
+
+    async def run():
+        stop = asyncio.Event()
+
+        async def worker():
+            while not stop.is_set():
+                async with pool.page():
+                    await asyncio.sleep(0.01)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(2)]
+        for _ in range(5):
+            await asyncio.sleep(0.05)
+            await pool.restart_browsers("memory")
+        await asyncio.sleep(0.05)
+        stop.set()
+        await asyncio.gather(*workers)
+
+    asyncio.run(run())
+
+    assert pool.browser_restarts["memory"] == 5
+    assert len(playwright.launched) == 6
+    # Every replaced browser was closed once its last context was recycled
+    assert all(not browser.connected for browser in playwright.launched[:-1])
+    assert not pool._browsers_to_restart
+    assert not pool._draining_browsers
+
+
+def test_pools_are_kept_per_event_loop_and_closed_on_their_own_loop(monkeypatch):
+    monkeypatch.setattr(scraper, "async_playwright", FakePlaywright)
+    monkeypatch.setattr(scraper, "_browser_pools", {})
+    monkeypatch.setattr(scraper, "StorageStateCache", lambda: None)
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def start_pool():
+        pool = scraper.get_browser_pool()
+        await pool.start()
+        return pool
+
+    other_pool = asyncio.run_coroutine_threadsafe(start_pool(), other_loop).result()
+
+    async def run():
+        pool = await start_pool()
+        assert pool is not other_pool
+        assert scraper.get_browser_pool() is pool
+        await scraper.close_browser_pool()
+        return pool
+
+    pool = asyncio.run(run())
+
+    other_loop.call_soon_threadsafe(other_loop.stop)
+    thread.join()
+    other_loop.close()
+
+    assert pool.playwright is None
+    assert other_pool.playwright is None
+    assert not scraper._browser_pools